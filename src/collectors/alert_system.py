@@ -94,6 +94,12 @@ class AlertSystem:
             "DeepMind", "Inflection", "Stability AI"
         ]
 
+        # 小写形式预先算好，优先级判断和公司提取时直接与小写文本比较
+        self._regulatory_keywords_lower = tuple(
+            kw.lower() for kw in self.p0_triggers["regulatory_keywords"]
+        )
+        self._priority_companies_lower = tuple(c.lower() for c in self.priority_companies)
+
     def _generate_alert_id(self) -> str:
         """生成警报ID"""
         self.alert_counter += 1
@@ -241,13 +247,13 @@ class AlertSystem:
         text = f"{news.get('title', '')} {news.get('summary', '')} {news.get('content', '')}".lower()
 
         # 检查P0触发关键词
-        for keyword in self.p0_triggers["regulatory_keywords"]:
-            if keyword.lower() in text:
+        for keyword in self._regulatory_keywords_lower:
+            if keyword in text:
                 return AlertPriority.P0.value
 
         # 检查是否涉及优先公司
-        for company in self.priority_companies:
-            if company.lower() in text:
+        for company in self._priority_companies_lower:
+            if company in text:
                 return AlertPriority.P1.value
 
         return AlertPriority.P2.value
@@ -349,8 +355,8 @@ class AlertSystem:
     def _extract_company_from_text(self, text: str) -> Optional[str]:
         """从文本中提取公司名"""
         text_lower = text.lower()
-        for company in self.priority_companies:
-            if company.lower() in text_lower:
+        for company, company_lower in zip(self.priority_companies, self._priority_companies_lower):
+            if company_lower in text_lower:
                 return company
         return None
 
@@ -105,6 +105,10 @@ class BlogCollector:
             "partnership", "collaboration", "integration",
         ]
 
+        # 小写关键词只转换一次，供 _calculate_priority 逐篇匹配
+        self._p0_keywords_lower = tuple(kw.lower() for kw in self.p0_keywords)
+        self._p1_keywords_lower = tuple(kw.lower() for kw in self.p1_keywords)
+
         self.headers = {
             "User-Agent": "AI Investment News Monitor/1.0"
         }
@@ -222,13 +226,13 @@ class BlogCollector:
         text = f"{title} {summary}".lower()
 
         # P0: 产品发布、重大更新
-        for keyword in self.p0_keywords:
-            if keyword.lower() in text:
+        for keyword in self._p0_keywords_lower:
+            if keyword in text:
                 return "P0"
 
         # P1: 技术文章、研究
-        for keyword in self.p1_keywords:
-            if keyword.lower() in text:
+        for keyword in self._p1_keywords_lower:
+            if keyword in text:
                 return "P1"
 
         # 基于公司优先级提升
@@ -58,6 +58,10 @@ class RegulatoryCollector:
             "consent decree", "enforcement action",
         ]
 
+        # 预先转为小写，过滤和定级时不再逐词调用 lower()
+        self._ai_keywords_lower = tuple(kw.lower() for kw in self.ai_keywords)
+        self._critical_keywords_lower = tuple(kw.lower() for kw in self.critical_keywords)
+
         self.headers = {
             "User-Agent": "AI Investment News Analysis System/1.1"
         }
@@ -309,8 +313,8 @@ class RegulatoryCollector:
         """判断是否AI相关"""
         text = f"{news['title']} {news['summary']}".lower()
 
-        for keyword in self.ai_keywords:
-            if keyword.lower() in text:
+        for keyword in self._ai_keywords_lower:
+            if keyword in text:
                 return True
 
         return False
@@ -325,8 +329,8 @@ class RegulatoryCollector:
         text = f"{news['title']} {news['summary']} {news.get('content', '')}".lower()
 
         # 检查高敏感度关键词
-        for keyword in self.critical_keywords:
-            if keyword.lower() in text:
+        for keyword in self._critical_keywords_lower:
+            if keyword in text:
                 return "P0"
 
         # 如果标题包含公司名，提升优先级
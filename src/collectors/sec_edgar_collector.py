@@ -43,6 +43,8 @@ class SECEdgarCollector:
             "Google AI", "Meta AI", "Microsoft AI",
             "Amazon Web Services", "NVIDIA",
         ]
+        # 匹配用的小写关键词（构造时转换一次）
+        self._ai_keywords_lower = tuple(kw.lower() for kw in self.ai_keywords)
 
         # 重点监控的Form类型
         self.critical_forms = {
@@ -192,8 +194,8 @@ class SECEdgarCollector:
         """判断是否AI相关"""
         text = f"{filing['title']} {filing['summary']}".lower()
 
-        for keyword in self.ai_keywords:
-            if keyword.lower() in text:
+        for keyword in self._ai_keywords_lower:
+            if keyword in text:
                 return True
 
         return False
@@ -109,6 +109,10 @@ class TwitterMonitor:
             "safety", "alignment", "responsible",
         ]
 
+        # 小写关键词只转换一次，供 _calculate_priority 逐条匹配
+        self._p0_keywords_lower = tuple(kw.lower() for kw in self.p0_keywords)
+        self._p1_keywords_lower = tuple(kw.lower() for kw in self.p1_keywords)
+
         self.headers = {
             "User-Agent": "Mozilla/5.0 (compatible; AI Investment Monitor/1.0)"
         }
@@ -248,13 +252,13 @@ class TwitterMonitor:
         content_lower = content.lower()
 
         # P0: 重大公告关键词
-        for keyword in self.p0_keywords:
-            if keyword.lower() in content_lower:
+        for keyword in self._p0_keywords_lower:
+            if keyword in content_lower:
                 return "P0"
 
         # P1: 一般重要关键词
-        for keyword in self.p1_keywords:
-            if keyword.lower() in content_lower:
+        for keyword in self._p1_keywords_lower:
+            if keyword in content_lower:
                 return "P1"
 
         # 基于账号重要性
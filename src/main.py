@@ -15,7 +15,7 @@ from search.search_pipeline_v2 import SearchPipelineV2 as SearchPipeline
 from search.search_result_process import normalize_news
 from selector.news_selector import NewsSelectorPipeline
 from selector.investment_scorer import calculate_investment_scorecard
-from search.rss_config import MAX_NORMALIZED_ITEMS, USE_CONCURRENT, MAX_CONCURRENT
+from search.rss_config import MAX_NORMALIZED_ITEMS, USE_CONCURRENT, MAX_CONCURRENT, SEARCH_LOG_LEVEL
 from selector.selector_config import TOP_K_SELECT
 from event.event_pipeline import EventPipeline
 from event.decision import EventDecisionPipeline
@@ -29,6 +29,9 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+# search 包默认只输出 WARNING，主程序开启 INFO 进度日志（SEARCH_LOG_LEVEL 优先）
+if not SEARCH_LOG_LEVEL:
+    logging.getLogger("search").setLevel(logging.INFO)
 
 
 def generate_ai_news(hours: int = 24) -> Tuple[Dict[str, Any], Dict[str, Any]]:
@@ -100,8 +103,11 @@ def generate_ai_news(hours: int = 24) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         # 第四步：流程处理（去重→合并）
         # ============================================
         logger.info("第四步：使用SearchPipeline处理搜索结果（去重→合并相似新闻）...")
-        # 注意：skip_normalize=True，因为第二步已经规范化过了，避免丢失第三步添加的字段
-        processed_news, pipeline_stats = pipeline.process_results(news_list, skip_normalize=True)
+        # 注意：skip_normalize=True，因为第二步已经规范化过了，避免丢失第三步添加的字段；
+        # 输入来自 normalize_news，因此 validated=True
+        processed_news, pipeline_stats = pipeline.process_results(
+            news_list, skip_normalize=True, validated=True
+        )
         logger.info(f"流程处理完成，输出 {len(processed_news)} 条新闻")
         stats["pipeline_stats"] = pipeline_stats
 
@@ -1,6 +1,15 @@
 """Search module - RSS fetching and result processing"""
 
+import logging
+
 from .rss_config import *
+
+# 库默认静默：挂 NullHandler 并设为 WARNING，由应用入口或 SEARCH_LOG_LEVEL 开启详细日志
+_level = logging.getLevelName(SEARCH_LOG_LEVEL) if SEARCH_LOG_LEVEL else logging.WARNING
+_package_logger = logging.getLogger(__name__)
+_package_logger.addHandler(logging.NullHandler())
+_package_logger.setLevel(_level if isinstance(_level, int) else logging.WARNING)
+
 from .search_pipeline import SearchPipeline
 from .search_result_process import normalize_news, deduplicate_news, merge_similar_news
 
@@ -11,18 +11,30 @@
 """
 
 import asyncio
+import calendar
 import logging
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Tuple
-import feedparser
 from concurrent.futures import ThreadPoolExecutor
 import time
 
 # 导入配置
 try:
-    from .rss_config import RSS_SOURCES, MAX_ITEMS_PER_SOURCE, SEARCH_HOURS
+    from .rss_config import RSS_SOURCES, MAX_ITEMS_PER_SOURCE, SEARCH_HOURS, ENTRY_SCAN_FACTOR
+    from .http_client import fetch_feed
+    from .search_pipeline import SourceStats
 except ImportError:
-    from rss_config import RSS_SOURCES, MAX_ITEMS_PER_SOURCE, SEARCH_HOURS
+    from rss_config import RSS_SOURCES, MAX_ITEMS_PER_SOURCE, SEARCH_HOURS, ENTRY_SCAN_FACTOR
+    from http_client import fetch_feed
+    from search_pipeline import SourceStats
+
+
+@dataclass
+class FetchSourceStats(SourceStats):
+    """并发抓取时单个源的统计（额外记录耗时和错误信息）"""
+    fetch_time: float = 0.0
+    error: Optional[str] = None
 
 
 class ConcurrentRSSFetcher:
@@ -59,19 +71,14 @@ class ConcurrentRSSFetcher:
             "successful_fetches": 0,
             "failed_fetches": 0,
             "total_time": 0.0,
-            "avg_time_per_source": 0.0
+            "avg_time_per_source": 0.0,
+            "peak_concurrent": 0,  # 同时进行中的抓取数峰值（验证 max_concurrent 生效）
+            "max_source_latency": 0.0  # 最慢单个源的耗时（判断是否由个别慢源决定总耗时）
         }
 
     def _setup_logger(self) -> logging.Logger:
-        """设置日志记录器"""
-        logger = logging.getLogger(__name__)
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.INFO)
-        return logger
+        """获取日志记录器（级别与处理器由 search 包统一配置，默认 WARNING）"""
+        return logging.getLogger(__name__)
 
     async def fetch_single_rss(
         self,
@@ -94,14 +101,7 @@ class ConcurrentRSSFetcher:
         source_url = source['url']
 
         # 初始化统计信息
-        source_stats = {
-            "total_found": 0,
-            "valid_fetched": 0,
-            "skipped_no_time": 0,
-            "skipped_too_old": 0,
-            "fetch_time": 0.0,
-            "error": None
-        }
+        source_stats = FetchSourceStats()
 
         results = []
         start_time = time.time()
@@ -109,56 +109,59 @@ class ConcurrentRSSFetcher:
         try:
             self.logger.debug(f"开始抓取: {source_name}")
 
-            # 使用线程池执行feedparser.parse（因为它是阻塞的）
+            # 使用线程池执行阻塞的下载+解析（共享 Session 复用连接）
             # 在异步上下文中使用 get_running_loop() 获取当前事件循环
             loop = asyncio.get_running_loop()
             feed = await asyncio.wait_for(
-                loop.run_in_executor(executor, feedparser.parse, source_url),
+                loop.run_in_executor(executor, fetch_feed, source_url, self.timeout),
                 timeout=self.timeout
             )
 
-            # 检查RSS解析结果
-            if feed.bozo:
-                self.logger.warning(f"{source_name} RSS解析异常: {feed.bozo_exception}")
-
             if not feed.entries:
+                # 仅在没有解析出条目时才需要关注解析异常（截断或轻微不规范的源仍可用）
+                if feed.bozo:
+                    self.logger.warning(f"{source_name} RSS解析异常: {feed.get('bozo_exception')}")
                 self.logger.warning(f"{source_name} 没有找到任何条目")
-                source_stats["total_found"] = 0
-                return results, source_stats
+                source_stats.fetch_time = time.time() - start_time
+                return results, asdict(source_stats)
 
-            source_stats["total_found"] = len(feed.entries)
+            source_stats.total_found = len(feed.entries)
             self.logger.info(f"{source_name}: 找到 {len(feed.entries)} 条条目")
 
-            # 处理RSS条目
+            # 处理RSS条目（时间比较使用整数时间戳，避免逐条构造 datetime）
+            cutoff_epoch = cutoff_time.timestamp()
             valid_count = 0
-            for entry in feed.entries:
+            # 源按时间倒序，只检查前 max_items_per_source * ENTRY_SCAN_FACTOR 条
+            for entry in feed.entries[:self.max_items_per_source * ENTRY_SCAN_FACTOR]:
                 # 检查是否达到最大条数
                 if valid_count >= self.max_items_per_source:
                     break
 
                 try:
+                    # FeedParserDict 的 __getitem__/__getattr__ 带别名映射（Python 层实现），
+                    # 读取 title/summary/link/published_parsed 这些标准字段时直接走 dict.get
+                    published_parsed = dict.get(entry, "published_parsed")
+
                     # 检查发布时间
-                    if not hasattr(entry, "published_parsed") or not entry.published_parsed:
-                        source_stats["skipped_no_time"] += 1
+                    if not published_parsed:
+                        source_stats.skipped_no_time += 1
                         continue
 
-                    published_time = datetime(
-                        *entry.published_parsed[:6],
-                        tzinfo=timezone.utc
-                    )
+                    # published_parsed 为 UTC 的 struct_time
+                    pub_epoch = calendar.timegm(published_parsed)
 
                     # 检查是否过期
-                    if published_time < cutoff_time:
-                        source_stats["skipped_too_old"] += 1
+                    if pub_epoch < cutoff_epoch:
+                        source_stats.skipped_too_old += 1
                         continue
 
                     # 构建新闻项
                     news_item = {
-                        "title": entry.get("title", "未知标题"),
-                        "content": entry.get("summary", "无摘要"),
+                        "title": dict.get(entry, "title", "未知标题"),
+                        "content": dict.get(entry, "summary", "无摘要"),
                         "source": source_name,
-                        "url": entry.get("link", ""),
-                        "date": published_time.strftime("%Y-%m-%d %H:%M")
+                        "url": dict.get(entry, "link", ""),
+                        "date": time.strftime("%Y-%m-%d %H:%M", time.gmtime(pub_epoch))
                     }
 
                     results.append(news_item)
@@ -168,32 +171,39 @@ class ConcurrentRSSFetcher:
                     self.logger.debug(f"{source_name} 处理条目时出错: {e}")
                     continue
 
-            source_stats["valid_fetched"] = valid_count
-            source_stats["fetch_time"] = time.time() - start_time
+            source_stats.valid_fetched = valid_count
+            source_stats.fetch_time = time.time() - start_time
 
             self.logger.info(
                 f"✓ {source_name}: 成功获取 {valid_count} 条 "
-                f"(耗时: {source_stats['fetch_time']:.2f}s)"
+                f"(耗时: {source_stats.fetch_time:.2f}s)"
             )
 
         except asyncio.TimeoutError:
             error_msg = f"超时 (>{self.timeout}s)"
             self.logger.warning(f"✗ {source_name}: {error_msg}")
-            source_stats["error"] = error_msg
-            source_stats["fetch_time"] = time.time() - start_time
+            source_stats.error = error_msg
+            source_stats.fetch_time = time.time() - start_time
 
         except Exception as e:
             error_msg = str(e)
             self.logger.warning(f"✗ {source_name}: 抓取失败 - {error_msg}")
-            source_stats["error"] = error_msg
-            source_stats["fetch_time"] = time.time() - start_time
+            source_stats.error = error_msg
+            source_stats.fetch_time = time.time() - start_time
 
-        return results, source_stats
+        return results, asdict(source_stats)
 
-    async def fetch_all_rss_concurrent(self) -> Tuple[List[Dict], Dict]:
+    async def fetch_all_rss_concurrent(
+        self,
+        result_queue: Optional[asyncio.Queue] = None
+    ) -> Tuple[List[Dict], Dict]:
         """
         并发抓取所有RSS源
 
+        Args:
+            result_queue: 可选的结果队列，每个源抓取完成后立即放入
+                (source_name, news_list)，供下游边抓取边处理
+
         Returns:
             tuple: (news_list, stats_dict)
         """
@@ -220,16 +230,30 @@ class ConcurrentRSSFetcher:
             "error_sources": []       # 错误源
         }
 
-        # 使用上下文管理器管理线程池（用于执行阻塞的feedparser.parse）
+        # 使用上下文管理器管理线程池（用于执行阻塞的下载和 feedparser 解析）。
+        # 并发上限由信号量和线程池大小共同保证；下载走 requests 共享 Session，
+        # 不存在 aiohttp TCPConnector 默认 100 连接的隐式上限
         with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
             # 创建信号量控制并发数
             semaphore = asyncio.Semaphore(self.max_concurrent)
+            in_flight = 0
 
             async def fetch_with_semaphore(source):
+                nonlocal in_flight
                 async with semaphore:
-                    return await self.fetch_single_rss(source, cutoff_time, executor)
-
-            # 并发抓取所有源
+                    in_flight += 1
+                    if in_flight > self.perf_stats["peak_concurrent"]:
+                        self.perf_stats["peak_concurrent"] = in_flight
+                    try:
+                        result = await self.fetch_single_rss(source, cutoff_time, executor)
+                    finally:
+                        in_flight -= 1
+                if result_queue is not None:
+                    result_queue.put_nowait((source['name'], result[0]))
+                return result
+
+            # 并发抓取所有源。用 gather(return_exceptions=True) 而非 TaskGroup：单个源失败不应取消
+            # 其他源的抓取；每个源已由 wait_for 限定超时，慢源不会无限拖长总耗时
             tasks = [fetch_with_semaphore(source) for source in RSS_SOURCES]
             results_list = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -239,11 +263,7 @@ class ConcurrentRSSFetcher:
 
                 if isinstance(result, Exception):
                     self.logger.error(f"{source_name} 抓取异常: {result}")
-                    all_source_stats[source_name] = {
-                        "total_found": 0,
-                        "valid_fetched": 0,
-                        "error": str(result)
-                    }
+                    all_source_stats[source_name] = asdict(FetchSourceStats(error=str(result)))
                     source_classification["error_sources"].append(source_name)
                     self.perf_stats["failed_fetches"] += 1
                     continue
@@ -251,6 +271,8 @@ class ConcurrentRSSFetcher:
                 news_list, source_stats = result
                 all_results.extend(news_list)
                 all_source_stats[source_name] = source_stats
+                if source_stats["fetch_time"] > self.perf_stats["max_source_latency"]:
+                    self.perf_stats["max_source_latency"] = source_stats["fetch_time"]
 
                 # 分类源
                 if source_stats.get("error"):
@@ -370,6 +392,7 @@ def main():
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s'
     )
+    logging.getLogger("search").setLevel(logging.INFO)
 
     # 运行性能对比测试
     compare_performance()
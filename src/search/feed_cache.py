@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+RSS 解析结果磁盘缓存
+
+按 URL 持久化最近一次 200 响应的 ETag/Last-Modified 和解析后的条目，
+新进程发起条件请求得到 304 时直接从磁盘恢复条目，无需重新下载和解析。
+
+只保存抓取流程用到的字段（title/summary/link/published_parsed），
+序列化优先使用 orjson（未安装时回退到标准库 json），再用 gzip 压缩。
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import feedparser
+
+try:
+    from .rss_config import FEED_CACHE_DIR
+except ImportError:
+    from rss_config import FEED_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# 尝试导入orjson
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 缓存的条目字段
+_ENTRY_FIELDS = ("title", "summary", "link")
+
+
+def _dumps(data: Dict) -> bytes:
+    """序列化为 JSON 字节串"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Dict:
+    """反序列化 JSON 字节串"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _cache_path(url: str, cache_dir: Path) -> Path:
+    """URL 对应的缓存文件路径"""
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest}.json.gz"
+
+
+def get(url: str, cache_dir: Path = FEED_CACHE_DIR
+        ) -> Optional[Tuple[Optional[str], Optional[str], feedparser.FeedParserDict]]:
+    """
+    读取 URL 的缓存
+
+    Args:
+        url: RSS 源地址
+        cache_dir: 缓存目录
+
+    Returns:
+        (etag, last_modified, feed) 或 None（无缓存或缓存损坏）
+    """
+    path = _cache_path(url, cache_dir)
+    try:
+        data = _loads(gzip.decompress(path.read_bytes()))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"读取 RSS 缓存失败 {url}: {e}")
+        return None
+    if not isinstance(data, dict):
+        logger.debug(f"RSS 缓存格式无效 {url}: {type(data).__name__}")
+        return None
+
+    entries = []
+    for cached in data.get("entries", []):
+        entry = feedparser.FeedParserDict(
+            (field, cached[field]) for field in _ENTRY_FIELDS if field in cached
+        )
+        if cached.get("published_parsed"):
+            entry["published_parsed"] = time.struct_time(cached["published_parsed"])
+        entries.append(entry)
+
+    feed = feedparser.FeedParserDict(bozo=0, entries=entries)
+    return data.get("etag"), data.get("last_modified"), feed
+
+
+def put(url: str, etag: Optional[str], last_modified: Optional[str],
+        feed: feedparser.FeedParserDict, cache_dir: Path = FEED_CACHE_DIR) -> None:
+    """
+    写入 URL 的缓存（先写临时文件再原子替换，并发写同一源时不会产生半截文件）
+
+    Args:
+        url: RSS 源地址
+        etag: 响应的 ETag
+        last_modified: 响应的 Last-Modified
+        feed: feedparser 解析结果
+        cache_dir: 缓存目录
+    """
+    entries: List[Dict] = []
+    for entry in feed.entries:
+        cached = {field: dict.get(entry, field) for field in _ENTRY_FIELDS if field in entry}
+        published_parsed = dict.get(entry, "published_parsed")
+        if published_parsed:
+            cached["published_parsed"] = list(published_parsed)
+        entries.append(cached)
+
+    payload = gzip.compress(
+        _dumps({"url": url, "etag": etag, "last_modified": last_modified, "entries": entries}),
+        compresslevel=1
+    )
+
+    tmp_path = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, _cache_path(url, cache_dir))
+    except OSError as e:
+        # 写入或替换失败时删除临时文件，不在缓存目录中留下残留
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        logger.debug(f"写入 RSS 缓存失败 {url}: {e}")
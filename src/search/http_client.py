@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+共享 HTTP 客户端 - 进程内复用的 requests.Session
+
+所有 SearchPipeline / ConcurrentRSSFetcher 实例共用同一个连接池，
+重复运行管道时不再为每个 RSS 源重新建立 TCP/TLS 连接。
+
+RSS 下载采用流式读取并限制最大字节数，同时按源缓存 ETag/Last-Modified，
+未变化的源返回 304 时直接复用上次的解析结果（内存 LRU；设置 SEARCH_FEED_CACHE=1 时另有磁盘缓存，见 feed_cache）。
+"""
+
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from .rss_config import (
+        RSS_REQUEST_TIMEOUT, HTTP_POOL_SIZE, HTTP_HEADERS, RSS_MAX_FEED_BYTES, RSS_FEED_CACHE_SIZE,
+        FEED_CACHE_ENABLED
+    )
+    from . import feed_cache
+except ImportError:
+    from rss_config import (
+        RSS_REQUEST_TIMEOUT, HTTP_POOL_SIZE, HTTP_HEADERS, RSS_MAX_FEED_BYTES, RSS_FEED_CACHE_SIZE,
+        FEED_CACHE_ENABLED
+    )
+    import feed_cache
+
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# 条件请求缓存: url -> (etag, last_modified, 解析结果)，按最近使用顺序淘汰
+_feed_cache: "OrderedDict[str, Tuple[Optional[str], Optional[str], feedparser.FeedParserDict]]" = OrderedDict()
+_feed_cache_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    获取共享的 requests.Session（首次调用时懒加载创建）
+
+    Returns:
+        requests.Session: 带连接池的全局 Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(HTTP_HEADERS)
+                atexit.register(session.close)
+                _session = session
+    return _session
+
+
+def _read_capped(response: requests.Response, max_bytes: int) -> bytes:
+    """流式读取响应体，最多读取 max_bytes 字节"""
+    declared = response.headers.get("Content-Length")
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        logger.debug(f"{response.url} 声明大小 {declared} 字节，仅读取前 {max_bytes} 字节")
+
+    chunks = []
+    total = 0
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= max_bytes:
+            break
+    return b"".join(chunks)[:max_bytes]
+
+
+def _get_cached_feed(url: str) -> Optional[Tuple[Optional[str], Optional[str], feedparser.FeedParserDict]]:
+    """读取条件请求缓存（内存未命中时回退到磁盘缓存，命中时刷新 LRU 顺序）"""
+    with _feed_cache_lock:
+        cached = _feed_cache.get(url)
+        if cached is not None:
+            _feed_cache.move_to_end(url)
+            return cached
+
+    if not FEED_CACHE_ENABLED:
+        return None
+    cached = feed_cache.get(url)
+    if cached is not None:
+        _put_cached_feed(url, *cached)
+    return cached
+
+
+def _put_cached_feed(url: str, etag: Optional[str], last_modified: Optional[str],
+                     feed: feedparser.FeedParserDict) -> None:
+    """写入条件请求缓存，超出容量时淘汰最久未使用的源"""
+    with _feed_cache_lock:
+        _feed_cache[url] = (etag, last_modified, feed)
+        _feed_cache.move_to_end(url)
+        while len(_feed_cache) > RSS_FEED_CACHE_SIZE:
+            _feed_cache.popitem(last=False)
+
+
+def fetch_feed(url: str, timeout: float = RSS_REQUEST_TIMEOUT) -> feedparser.FeedParserDict:
+    """
+    通过共享 Session 下载并解析 RSS 源
+
+    带上次响应的 ETag/Last-Modified 发起条件请求，304 时直接返回缓存的解析结果；
+    响应体流式读取，最多 RSS_MAX_FEED_BYTES 字节。
+
+    Args:
+        url: RSS 源地址
+        timeout: 请求超时时间（秒）
+
+    Returns:
+        feedparser.FeedParserDict: 解析结果（非 2xx 响应同样交给 feedparser，
+            通常解析为无条目的结果）
+    """
+    cached = _get_cached_feed(url)
+    request_headers: Dict[str, str] = {}
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            request_headers["If-None-Match"] = etag
+        if last_modified:
+            request_headers["If-Modified-Since"] = last_modified
+
+    with get_session().get(url, timeout=timeout, headers=request_headers, stream=True) as response:
+        if response.status_code == 304 and cached is not None:
+            logger.debug(f"{url} 未变化（304），复用缓存的解析结果")
+            return cached[2]
+        content = _read_capped(response, RSS_MAX_FEED_BYTES)
+        # feedparser 按小写键读取 content-type 等响应头
+        response_headers = {key.lower(): value for key, value in response.headers.items()}
+        status_ok = response.ok
+
+    feed = feedparser.parse(content, response_headers=response_headers)
+
+    etag = response_headers.get("etag")
+    last_modified = response_headers.get("last-modified")
+    if status_ok and feed.entries and (etag or last_modified):
+        _put_cached_feed(url, etag, last_modified, feed)
+        if FEED_CACHE_ENABLED:
+            feed_cache.put(url, etag, last_modified, feed)
+
+    return feed
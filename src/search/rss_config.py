@@ -2,6 +2,9 @@
 # RSS 源配置文件
 # 用于存储所有 RSS 源的 URL 和名称，便于集中管理和维护
 
+import os
+from pathlib import Path
+
 RSS_SOURCES = [
     # ===== A. 一线科技 / 投资媒体 =====
     {"name": "VentureBeat AI", "url": "https://venturebeat.com/category/ai/feed/"},
@@ -95,3 +98,49 @@ MAX_NORMALIZED_ITEMS = 500  # 规范化输出的最大条数
 # 并发抓取配置
 USE_CONCURRENT = True  # 是否启用并发模式（True=并发，False=串行）
 MAX_CONCURRENT = 10  # 并发数（推荐：10，最佳性能和资源平衡）
+
+# HTTP 连接池配置（所有管道实例共享同一个 Session，复用 TCP/TLS 连接）
+RSS_REQUEST_TIMEOUT = 15  # 单个 RSS 请求超时时间（秒）
+HTTP_POOL_SIZE = 50  # 连接池大小（每个主机的最大保活连接数）
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; AI Investment News/1.3; +feedparser)",
+    "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8",
+}
+RSS_MAX_FEED_BYTES = 1024 * 1024  # 单个 RSS 源最多读取的字节数（源按时间倒序，超出部分不会被用到）
+RSS_FEED_CACHE_SIZE = 256  # 条件请求（ETag/Last-Modified）缓存的最大源数量
+
+# RSS 磁盘缓存配置（按 ETag/Last-Modified 持久化解析结果，跨进程复用）
+# 默认关闭，不在用户目录下写文件；设置环境变量 SEARCH_FEED_CACHE=1 开启，
+# SEARCH_FEED_CACHE_DIR 可指定缓存目录
+FEED_CACHE_ENABLED = os.getenv("SEARCH_FEED_CACHE", "0") == "1"
+FEED_CACHE_DIR = Path(
+    os.getenv("SEARCH_FEED_CACHE_DIR", "~/.cache/ai-invest-news/feeds")
+).expanduser()
+
+# 条目扫描范围：RSS 源按发布时间倒序，每个源最多检查 MAX_ITEMS_PER_SOURCE 的该倍数条条目
+# （为无发布时间/过期的条目预留余量，超出部分不再逐条检查）
+ENTRY_SCAN_FACTOR = 3
+
+# 日志级别：search 包默认只输出 WARNING 及以上（库内挂 NullHandler）
+# 需要详细日志时设置环境变量 SEARCH_LOG_LEVEL=INFO/DEBUG，或在应用入口调用
+# logging.getLogger("search").setLevel(logging.INFO)
+SEARCH_LOG_LEVEL = os.getenv("SEARCH_LOG_LEVEL", "").upper()
+
+# search/__init__.py 以 from .rss_config import * 导出配置项，不带出 os、Path 等模块名
+__all__ = [
+    "RSS_SOURCES",
+    "SEARCH_HOURS",
+    "MAX_ITEMS_PER_SOURCE",
+    "MAX_NORMALIZED_ITEMS",
+    "USE_CONCURRENT",
+    "MAX_CONCURRENT",
+    "RSS_REQUEST_TIMEOUT",
+    "HTTP_POOL_SIZE",
+    "HTTP_HEADERS",
+    "RSS_MAX_FEED_BYTES",
+    "RSS_FEED_CACHE_SIZE",
+    "FEED_CACHE_ENABLED",
+    "FEED_CACHE_DIR",
+    "ENTRY_SCAN_FACTOR",
+    "SEARCH_LOG_LEVEL",
+]
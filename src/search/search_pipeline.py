@@ -5,8 +5,10 @@ SearchPipeline - 搜索结果处理流程管道类
 该类统一管理RSS搜索、结果处理和统计分析的完整流程。
 """
 
-import feedparser
+import calendar
 import logging
+import time
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Tuple
 
@@ -15,11 +17,30 @@ if __name__ == "__main__":
     import sys
     import os
     sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-    from search.rss_config import RSS_SOURCES, MAX_ITEMS_PER_SOURCE, SEARCH_HOURS, MAX_NORMALIZED_ITEMS
+    from search.rss_config import (
+        RSS_SOURCES, MAX_ITEMS_PER_SOURCE, SEARCH_HOURS, MAX_NORMALIZED_ITEMS, ENTRY_SCAN_FACTOR
+    )
     from search.search_result_process import SearchResultProcessor
+    from search.http_client import fetch_feed
 else:
-    from .rss_config import RSS_SOURCES, MAX_ITEMS_PER_SOURCE, SEARCH_HOURS, MAX_NORMALIZED_ITEMS
+    from .rss_config import (
+        RSS_SOURCES, MAX_ITEMS_PER_SOURCE, SEARCH_HOURS, MAX_NORMALIZED_ITEMS, ENTRY_SCAN_FACTOR
+    )
     from .search_result_process import SearchResultProcessor
+    from .http_client import fetch_feed
+
+
+# 全部 RSS 源名称（模块加载时计算一次，用于补全未分类的源）
+_ALL_SOURCE_NAMES = frozenset(source['name'] for source in RSS_SOURCES)
+
+
+@dataclass
+class SourceStats:
+    """单个 RSS 源的抓取统计（返回前通过 asdict 转为字典）"""
+    total_found: int = 0
+    valid_fetched: int = 0
+    skipped_no_time: int = 0
+    skipped_too_old: int = 0
 
 
 class SearchPipeline:
@@ -36,17 +57,17 @@ class SearchPipeline:
         self.hours = hours
         self.max_items_per_source = max_items_per_source
         self.logger = self._setup_logger()
+        self._processor: Optional[SearchResultProcessor] = None
     
     def _setup_logger(self) -> logging.Logger:
-        """设置日志记录器"""
-        logger = logging.getLogger(__name__)
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.DEBUG)
-        return logger
+        """获取日志记录器（级别与处理器由 search 包统一配置，默认 WARNING）"""
+        return logging.getLogger(__name__)
+    
+    def _get_processor(self, max_items: int) -> SearchResultProcessor:
+        """获取结果处理器（跨调用复用，仅在 max_items 变化时重建）"""
+        if self._processor is None or self._processor.max_items != max_items:
+            self._processor = SearchResultProcessor(max_items=max_items)
+        return self._processor
     
     def search_recent_ai_news(self) -> Tuple[List[Dict], Dict]:
         """
@@ -60,82 +81,87 @@ class SearchPipeline:
         self.logger.info(f"开始搜索最近 {self.hours} 小时的 AI 新闻，每个源最多 {self.max_items_per_source} 条")
         
         results = []
-        source_stats = {}  # 统计每个源的条数
+        source_stats: Dict[str, SourceStats] = {}  # 统计每个源的条数
         
         # 源分类统计
-        source_classification = {
-            "valid_sources": [],      # 有效源：有搜索结果，且有没过期的新闻
-            "expired_sources": [],    # 过期源：有搜索结果，但都是过期的新闻
-            "invalid_sources": []     # 无效源：没有搜索结果
-        }
+        valid_sources = []      # 有效源：有搜索结果，且有没过期的新闻
+        expired_sources = []    # 过期源：有搜索结果，但都是过期的新闻
+        invalid_sources = []    # 无效源：没有搜索结果
+        classified_sources = set()  # 已分类的源名称
         
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=self.hours)
+        now = datetime.now(timezone.utc)
+        cutoff_time = now - timedelta(hours=self.hours)
+        # 条目时间比较使用整数时间戳，避免逐条构造 datetime
+        cutoff_epoch = cutoff_time.timestamp()
         self.logger.info(f"时间截断点（UTC）: {cutoff_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        self.logger.info(f"当前时间（UTC）: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')}")
+        self.logger.info(f"当前时间（UTC）: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+        debug = self.logger.isEnabledFor(logging.DEBUG)  # 关闭 DEBUG 时逐条目循环内不构造日志字符串
 
         for source in RSS_SOURCES:
             self.logger.info(f"正在从 {source['name']} 获取 RSS 源...")
             self.logger.debug(f"RSS URL: {source['url']}")
             
-            source_stats[source['name']] = {
-                "total_found": 0,
-                "valid_fetched": 0,
-                "skipped_no_time": 0,
-                "skipped_too_old": 0
-            }
+            stats = source_stats[source['name']] = SourceStats()
             
             try:
-                feed = feedparser.parse(source["url"])
-                
-                # 检查 RSS 解析是否有错误
-                if feed.bozo:
-                    self.logger.warning(f"{source['name']} RSS 解析异常: {feed.bozo_exception}")
+                feed = fetch_feed(source["url"])
                 
                 if not feed.entries:
+                    # 仅在没有解析出条目时才需要关注解析异常（截断或轻微不规范的源仍可用）
+                    if feed.bozo:
+                        self.logger.warning(f"{source['name']} RSS 解析异常: {feed.get('bozo_exception')}")
                     self.logger.warning(f"{source['name']} 没有找到任何条目")
-                    source_stats[source['name']]["total_found"] = 0
-                    source_classification["invalid_sources"].append(source['name'])
+                    invalid_sources.append(source['name'])
+                    classified_sources.add(source['name'])
                     continue
                     
-                source_stats[source['name']]["total_found"] = len(feed.entries)
+                stats.total_found = len(feed.entries)
                 self.logger.info(f"从 {source['name']} 获取到 {len(feed.entries)} 条条目")
                 
                 valid_count = 0
                 skipped_no_time = 0
                 skipped_too_old = 0
                 
-                for idx, entry in enumerate(feed.entries, 1):
+                # 源按时间倒序，只检查前 max_items_per_source * ENTRY_SCAN_FACTOR 条
+                candidates = feed.entries[:self.max_items_per_source * ENTRY_SCAN_FACTOR]
+                for idx, entry in enumerate(candidates, 1):
                     # 检查是否已经达到该源的最大条数
                     if valid_count >= self.max_items_per_source:
                         self.logger.debug(f"[{source['name']}] 已达最大条数限制 ({self.max_items_per_source})，停止处理")
                         break
                     
                     try:
+                        # FeedParserDict 的 __getitem__/__getattr__ 带别名映射（Python 层实现），
+                        # 读取 title/summary/link/published_parsed 这些标准字段时直接走 dict.get
+                        published_parsed = dict.get(entry, "published_parsed")
+                        
                         # 检查是否有发布时间
-                        if not hasattr(entry, "published_parsed") or not entry.published_parsed:
-                            title = getattr(entry, 'title', '未知标题')
-                            self.logger.debug(f"[{idx}] 跳过条目（无发布时间）: {title}")
+                        if not published_parsed:
+                            if debug:
+                                title = dict.get(entry, "title", "未知标题")
+                                self.logger.debug(f"[{idx}] 跳过条目（无发布时间）: {title}")
                             skipped_no_time += 1
                             continue
 
-                        published_time = datetime(
-                                *entry.published_parsed[:6],
-                                 tzinfo=timezone.utc
-                        )
-                        self.logger.debug(f"[{idx}] 条目时间: {published_time.strftime('%Y-%m-%d %H:%M:%S')}")
+                        # published_parsed 为 UTC 的 struct_time
+                        pub_epoch = calendar.timegm(published_parsed)
+                        published_struct = time.gmtime(pub_epoch)
+                        if debug:
+                            self.logger.debug(f"[{idx}] 条目时间: {time.strftime('%Y-%m-%d %H:%M:%S', published_struct)}")
 
-                        if published_time < cutoff_time:
-                            title = entry.get("title", "未知标题")
-                            self.logger.debug(f"[{idx}] 跳过过期条目 ({published_time.strftime('%Y-%m-%d %H:%M:%S')}): {title}")
+                        if pub_epoch < cutoff_epoch:
+                            if debug:
+                                title = dict.get(entry, "title", "未知标题")
+                                self.logger.debug(f"[{idx}] 跳过过期条目 ({time.strftime('%Y-%m-%d %H:%M:%S', published_struct)}): {title}")
                             skipped_too_old += 1
                             continue
 
                         news_item = {
-                            "title": entry.get("title", "未知标题"),
-                            "content": entry.get("summary", "无摘要"),
+                            "title": dict.get(entry, "title", "未知标题"),
+                            "content": dict.get(entry, "summary", "无摘要"),
                             "source": source["name"],
-                            "url": entry.get("link", ""),
-                            "date": published_time.strftime("%Y-%m-%d %H:%M")
+                            "url": dict.get(entry, "link", ""),
+                            "date": time.strftime("%Y-%m-%d %H:%M", published_struct)
                         }
                         
                         results.append(news_item)
@@ -143,21 +169,23 @@ class SearchPipeline:
                         self.logger.info(f"[{idx}] ✓ 成功添加新闻: {news_item['title'][:50]}...")
                         
                     except Exception as e:
-                        self.logger.error(f"[{idx}] 处理条目时出错: {e}", exc_info=True)
+                        self.logger.error(f"[{idx}] 处理条目时出错: {e}")
                         continue
                 
-                source_stats[source['name']]["valid_fetched"] = valid_count
-                source_stats[source['name']]["skipped_no_time"] = skipped_no_time
-                source_stats[source['name']]["skipped_too_old"] = skipped_too_old
+                stats.valid_fetched = valid_count
+                stats.skipped_no_time = skipped_no_time
+                stats.skipped_too_old = skipped_too_old
                 
                 self.logger.info(f"{source['name']} 统计 - 有效: {valid_count}, 无时间: {skipped_no_time}, 过期: {skipped_too_old}")
                 
                 # 源分类：有效源 vs 过期源
                 if valid_count > 0:
-                    source_classification["valid_sources"].append(source['name'])
+                    valid_sources.append(source['name'])
+                    classified_sources.add(source['name'])
                 elif skipped_too_old > 0:
                     # 有搜索结果但都过期
-                    source_classification["expired_sources"].append(source['name'])
+                    expired_sources.append(source['name'])
+                    classified_sources.add(source['name'])
                         
             except Exception as e:
                 self.logger.error(f"从 {source['name']} 获取 RSS 失败: {e}", exc_info=True)
@@ -166,20 +194,15 @@ class SearchPipeline:
         self.logger.info(f"搜索完成，共找到 {len(results)} 条新闻")
         
         # 补全源分类统计（可能存在既没搜到也没过期的源）
-        all_source_names = {source['name'] for source in RSS_SOURCES}
-        classified_sources = (set(source_classification["valid_sources"]) | 
-                             set(source_classification["expired_sources"]) | 
-                             set(source_classification["invalid_sources"]))
-        unclassified = all_source_names - classified_sources
-        source_classification["invalid_sources"].extend(list(unclassified))
+        invalid_sources.extend(_ALL_SOURCE_NAMES - classified_sources)
         
         # 添加源分类统计到返回结果
         stats_with_classification = {
-            "sources": source_stats,
+            "sources": {name: asdict(stats) for name, stats in source_stats.items()},
             "source_classification": {
-                "valid_sources": source_classification["valid_sources"],
-                "expired_sources": source_classification["expired_sources"],
-                "invalid_sources": source_classification["invalid_sources"]
+                "valid_sources": valid_sources,
+                "expired_sources": expired_sources,
+                "invalid_sources": invalid_sources
             }
         }
         
@@ -218,7 +241,7 @@ class SearchPipeline:
         
         try:
             # 使用SearchResultProcessor进行结果处理
-            processor = SearchResultProcessor(max_items=max_normalized_items)
+            processor = self._get_processor(max_normalized_items)
             
             # 步骤1：规范化（可选跳过）
             if skip_normalize:
@@ -10,8 +10,10 @@ SearchPipeline v2 - 支持并发和串行两种抓取模式
 - 详细的性能统计
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Tuple
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
 
 # 导入配置
 try:
@@ -48,6 +50,7 @@ class SearchPipelineV2:
         self.use_concurrent = use_concurrent
         self.max_concurrent = max_concurrent
         self.logger = self._setup_logger()
+        self._processor: Optional[SearchResultProcessor] = None
 
         # 初始化抓取器
         if use_concurrent:
@@ -70,15 +73,14 @@ class SearchPipelineV2:
             )
 
     def _setup_logger(self) -> logging.Logger:
-        """设置日志记录器"""
-        logger = logging.getLogger(__name__)
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.INFO)
-        return logger
+        """获取日志记录器（级别与处理器由 search 包统一配置，默认 WARNING）"""
+        return logging.getLogger(__name__)
+
+    def _get_processor(self, max_items: int) -> SearchResultProcessor:
+        """获取结果处理器（跨调用复用，仅在 max_items 变化时重建）"""
+        if self._processor is None or self._processor.max_items != max_items:
+            self._processor = SearchResultProcessor(max_items=max_items)
+        return self._processor
 
     def search_recent_ai_news(self) -> Tuple[List[Dict], Dict]:
         """
@@ -97,11 +99,69 @@ class SearchPipelineV2:
             # 使用串行抓取
             return self.fetcher.search_recent_ai_news()
 
+    async def _search_and_normalize_streaming(
+        self,
+        max_normalized_items: int = MAX_NORMALIZED_ITEMS
+    ) -> Tuple[List[Dict], Dict, List[Dict], Dict]:
+        """
+        并发抓取的同时逐源校验新闻（生产者/消费者），隐藏规范化耗时
+
+        抓取器每完成一个源就把结果放入队列，消费者立即校验该源的条目；
+        全部抓取完成后按源顺序拼接，结果与先抓取再 normalize_news 完全一致。
+
+        Args:
+            max_normalized_items: 规范化输出的最大条数
+
+        Returns:
+            tuple: (raw_news, search_stats, normalized_news, normalize_stats)
+        """
+        if max_normalized_items <= 0:
+            raise ValueError(f"max_items 必须大于 0，但收到 {max_normalized_items}")
+
+        processor = self._get_processor(max_normalized_items)
+        queue: asyncio.Queue = asyncio.Queue()
+        validated_by_source: Dict[str, List[Optional[Dict]]] = {}
+
+        async def consume():
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    return
+                source_name, news_list = batch
+                validated_by_source[source_name] = [
+                    processor.validate_news_item(item, idx)
+                    for idx, item in enumerate(news_list, 1)
+                ]
+
+        consumer = asyncio.create_task(consume())
+        try:
+            raw_news, search_stats = await self.fetcher.fetch_all_rss_concurrent(result_queue=queue)
+        finally:
+            queue.put_nowait(None)
+            await consumer
+
+        # 按源顺序拼接（与 raw_news 顺序一致），只保留前 max_items 条中校验通过的
+        validated = [
+            item
+            for source in RSS_SOURCES
+            for item in validated_by_source.get(source['name'], ())
+        ][:max_normalized_items]
+        normalized_news = [item for item in validated if item]
+
+        source_count = dict(Counter(item["source"] for item in normalized_news))
+
+        self.logger.info(
+            f"边抓取边规范化完成 - 有效: {len(normalized_news)} 条，"
+            f"跳过: {len(validated) - len(normalized_news)} 条"
+        )
+        return raw_news, search_stats, normalized_news, source_count
+
     def process_results(
         self,
         raw_news: List[Dict],
         max_normalized_items: int = MAX_NORMALIZED_ITEMS,
-        skip_normalize: bool = False
+        skip_normalize: bool = False,
+        validated: bool = False
     ) -> Tuple[List[Dict], Dict]:
         """
         处理搜索结果：规范化 -> 去重 -> 合并相似
@@ -110,6 +170,8 @@ class SearchPipelineV2:
             raw_news: 原始新闻列表
             max_normalized_items: 规范化输出的最大条数
             skip_normalize: 是否跳过规范化步骤
+            validated: 跳过规范化时，输入是否已由 normalize_news 规范化
+                （均为含字符串 title 的字典），为 True 时合并步骤跳过逐条检查
 
         Returns:
             tuple: (processed_news, pipeline_stats)
@@ -127,7 +189,7 @@ class SearchPipelineV2:
         }
 
         try:
-            processor = SearchResultProcessor(max_items=max_normalized_items)
+            processor = self._get_processor(max_normalized_items)
 
             # 步骤1：规范化
             if skip_normalize:
@@ -159,7 +221,11 @@ class SearchPipelineV2:
 
             # 步骤3：合并相似
             self.logger.info(f"【步骤3】合并相似 - 输入: {len(dedup_news)} 条")
-            merged_news, merge_stats = processor.merge_similar_news(dedup_news)
+            # 经过规范化的条目均为含字符串 title 的字典，可跳过逐条检查；
+            # 跳过规范化且调用方未声明 validated 时输入未经校验，仍逐条检查
+            merged_news, merge_stats = processor.merge_similar_news(
+                dedup_news, validated=validated or not skip_normalize
+            )
             pipeline_stats["step3_merge"] = merge_stats
             self.logger.info(
                 f"合并完成 - 输出: {len(merged_news)} 条，"
@@ -205,15 +271,32 @@ class SearchPipelineV2:
         self.logger.info("开始运行完整搜索处理管道 v2")
         self.logger.info("=" * 50)
 
-        # 步骤1：搜索新闻
-        raw_news, search_stats = self.search_recent_ai_news()
+        if self.use_concurrent:
+            # 步骤1：并发搜索新闻，同时逐源规范化
+            raw_news, search_stats, normalized_news, normalize_stats = asyncio.run(
+                self._search_and_normalize_streaming()
+            )
+
+            if not raw_news:
+                self.logger.warning("搜索阶段未找到任何新闻")
+                return [], {"search": search_stats, "processing": {}}
+
+            # 步骤2：处理结果（规范化已在抓取时完成）
+            processed_news, process_stats = self.process_results(
+                normalized_news, skip_normalize=True, validated=True
+            )
+            process_stats["input_count"] = len(raw_news)
+            process_stats["step1_normalize"] = normalize_stats
+        else:
+            # 步骤1：搜索新闻
+            raw_news, search_stats = self.search_recent_ai_news()
 
-        if not raw_news:
-            self.logger.warning("搜索阶段未找到任何新闻")
-            return [], {"search": search_stats, "processing": {}}
+            if not raw_news:
+                self.logger.warning("搜索阶段未找到任何新闻")
+                return [], {"search": search_stats, "processing": {}}
 
-        # 步骤2：处理结果
-        processed_news, process_stats = self.process_results(raw_news)
+            # 步骤2：处理结果
+            processed_news, process_stats = self.process_results(raw_news)
 
         combined_stats = {
             "search": search_stats,
@@ -249,6 +332,7 @@ def main():
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s'
     )
+    logging.getLogger("search").setLevel(logging.INFO)
 
     logger = logging.getLogger(__name__)
 
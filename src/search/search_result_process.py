@@ -7,14 +7,66 @@
 """
 
 import logging
+import operator
+import re
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
 from typing import List, Dict, Any, Optional, Tuple
 
 
+# 预编译分词正则：每个 CJK 汉字单独成词，其余为连续的字母/数字（不含下划线和标点）
+_TOKEN_RE = re.compile(r"[\u4e00-\u9fff]|[^\W_\u4e00-\u9fff]+")
+
+
+@lru_cache(maxsize=8192)
+def _normalize_text(text: str) -> str:
+    """
+    规范化短文本字段（标题、来源等）：去除首尾空白。
+
+    新闻在 24 小时窗口内会被多次抓取，相同标题反复出现，
+    使用 lru_cache 将重复规范化变为 O(1) 查表。
+    """
+    return text.strip()
+
+
+@lru_cache(maxsize=8192)
+def _dedup_title(title: str) -> str:
+    """去重键中的标题部分（转小写并去除首尾空白），按标题缓存，重复标题不再逐次生成小写副本"""
+    return title.lower().strip()
+
+
+@lru_cache(maxsize=16384)
+def _title_tokens(title: str) -> frozenset:
+    """
+    标题分词（casefold 后按 _TOKEN_RE 切分）的缓存结果。
+
+    中文标题不含空格，按字切分才能得到有意义的重叠率；英文标点不再粘在词上。
+    合并相似新闻时同一标题会与许多条目比较，缓存后每个标题只分词一次。
+    """
+    return frozenset(_TOKEN_RE.findall(title.casefold()))
+
+
+@lru_cache(maxsize=8192)
+def _title_overlap(title_a: str, title_b: str) -> float:
+    """
+    两个标题的词重叠率（公共词数 / 较短标题词数），任一标题无词时为 0。
+
+    重叠率对称，调用方按 (较小, 较大) 顺序传参，使 (a, b) 与 (b, a) 共用一个缓存项。
+    """
+    words_a = _title_tokens(title_a)
+    words_b = _title_tokens(title_b)
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / min(len(words_a), len(words_b))
+
+
 class SearchResultProcessor:
     """搜索结果处理器类，统一管理搜索结果的处理流程"""
     
     # 配置常量
     REQUIRED_FIELDS = ["title", "content", "source", "date", "url"]
+    _get_required = operator.itemgetter(*REQUIRED_FIELDS)  # 一次取出全部必需字段
     SIMILARITY_THRESHOLD = 0.6
     
     def __init__(self, max_items: int = 10, similarity_threshold: float = 0.6):
@@ -30,15 +82,8 @@ class SearchResultProcessor:
         self.logger = self._setup_logger()
     
     def _setup_logger(self) -> logging.Logger:
-        """设置日志记录器"""
-        logger = logging.getLogger(__name__)
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.DEBUG)
-        return logger
+        """获取日志记录器（级别与处理器由 search 包统一配置，默认 WARNING）"""
+        return logging.getLogger(__name__)
     
     def validate_news_item(self, item: Dict[str, Any], index: int) -> Optional[Dict[str, Any]]:
         """
@@ -51,38 +96,45 @@ class SearchResultProcessor:
         Returns:
             验证通过的新闻字典，或 None 如果验证失败
         """
-        if not isinstance(item, dict):
-            self.logger.warning(f"[{index}] 条目不是字典类型: {type(item)}")
-            return None
-        
         try:
-            # 检查必需字段
-            missing_fields = [field for field in self.REQUIRED_FIELDS if field not in item]
-            if missing_fields:
+            # 检查必需字段（itemgetter 一次取出，缺字段时抛 KeyError，非映射类型抛 TypeError）
+            try:
+                title, content, source, date, url = self._get_required(item)
+            except KeyError:
+                missing_fields = [field for field in self.REQUIRED_FIELDS if field not in item]
                 self.logger.warning(f"[{index}] 缺少必需字段: {missing_fields}，标题: {item.get('title', '未知')}")
                 return None
+            except TypeError:
+                self.logger.warning(f"[{index}] 条目不是字典类型: {type(item)}")
+                return None
             
-            # 检查字段非空
-            for field in self.REQUIRED_FIELDS:
-                if not item[field] or (isinstance(item[field], str) and not item[field].strip()):
-                    self.logger.warning(f"[{index}] 字段为空或仅空格: {field}，标题: {item.get('title', '未知')}")
-                    return None
+            # 清理必需字段；假值或清理后为空串（仅空格）均视为空
+            if title and content and source and date and url:
+                title = _normalize_text(str(title))
+                content = str(content).strip()
+                source = _normalize_text(str(source))
+                date = str(date).strip()
+                url = str(url).strip()
+            if not (title and content and source and date and url):
+                field = next(
+                    field for field in self.REQUIRED_FIELDS
+                    if not item[field] or (isinstance(item[field], str) and not item[field].strip())
+                )
+                self.logger.warning(f"[{index}] 字段为空或仅空格: {field}，标题: {item.get('title', '未知')}")
+                return None
             
-            # 清理和验证必需字段
+            # 保留原有的额外字段（如 fetched_content, fetched_title, fetch_stats,
+            # light_features, investment_info, ai_summary, investment_score 等），
+            # 必需字段用清理后的值覆盖
             validated_item = {
-                "title": str(item["title"]).strip(),
-                "content": str(item["content"]).strip(),
-                "source": str(item["source"]).strip(),
-                "date": str(item["date"]).strip(),
-                "url": str(item["url"]).strip()
+                **item,
+                "title": title,
+                "content": content,
+                "source": source,
+                "date": date,
+                "url": url
             }
             
-            # 保留原有的额外字段（如 fetched_content, fetched_title, fetch_stats,
-            # light_features, investment_info, ai_summary, investment_score 等）
-            for key, value in item.items():
-                if key not in validated_item:
-                    validated_item[key] = value
-            
             # 基本长度检查
             if len(validated_item["title"]) > 500:
                 self.logger.warning(f"[{index}] 标题过长（{len(validated_item['title'])}字），已截断")
@@ -92,11 +144,12 @@ class SearchResultProcessor:
                 self.logger.warning(f"[{index}] 内容过长（{len(validated_item['content'])}字），已截断")
                 validated_item["content"] = validated_item["content"][:2000]
             
-            self.logger.debug(f"[{index}] ✓ 条目验证成功: {validated_item['title'][:50]}...")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"[{index}] ✓ 条目验证成功: {validated_item['title'][:50]}...")
             return validated_item
             
         except Exception as e:
-            self.logger.error(f"[{index}] 验证条目时出错: {e}", exc_info=True)
+            self.logger.error(f"[{index}] 验证条目时出错: {e}")
             return None
     
     def normalize_news(self, raw_news: List[Dict[str, Any]]) -> Tuple[List[Dict], Dict]:
@@ -128,7 +181,6 @@ class SearchResultProcessor:
         
         normalized = []
         skipped_count = 0
-        source_count = {}  # 统计每个源的最终条数
         
         # 只处理前 max_items 条
         for idx, item in enumerate(raw_news[:self.max_items], 1):
@@ -137,16 +189,17 @@ class SearchResultProcessor:
                 
                 if validated_item:
                     normalized.append(validated_item)
-                    source = validated_item["source"]
-                    source_count[source] = source_count.get(source, 0) + 1
                 else:
                     skipped_count += 1
                     
             except Exception as e:
-                self.logger.error(f"处理第 {idx} 条新闻时出错: {e}", exc_info=True)
+                self.logger.error(f"处理第 {idx} 条新闻时出错: {e}")
                 skipped_count += 1
                 continue
         
+        # 统计每个源的最终条数（Counter 的计数循环在 C 中完成）
+        source_count = dict(Counter(item["source"] for item in normalized))
+        
         self.logger.info(f"规范化完成 - 有效: {len(normalized)} 条，跳过: {skipped_count} 条")
         
         if not normalized:
@@ -168,18 +221,14 @@ class SearchResultProcessor:
         """
         self.logger.info(f"【步骤2】去重新闻数据 - 输入: {len(news_list)} 条")
         
-        seen = set()
-        result = []
-        removed_count = 0
-
+        # 以 (规范化标题, URL) 为键，setdefault 保留每个键首次出现的新闻（dict 保持插入顺序）
+        by_key: Dict[Tuple[str, str], Dict] = {}
+        dedup_title = _dedup_title
+        setdefault = by_key.setdefault
         for n in news_list:
-            key = (n["title"].lower().strip(), n["url"])
-            if key in seen:
-                removed_count += 1
-                self.logger.debug(f"重复检测: {n['title'][:50]}...")
-                continue
-            seen.add(key)
-            result.append(n)
+            setdefault((dedup_title(n["title"]), n["url"]), n)
+        result = list(by_key.values())
+        removed_count = len(news_list) - len(result)
 
         dedup_stats = {
             "removed_count": removed_count,
@@ -211,30 +260,35 @@ class SearchResultProcessor:
                 self.logger.debug(f"标题不是字符串类型")
                 return False
             
-            # 转换为小写并分割单词
-            words_a = set(title_a.lower().split())
-            words_b = set(title_b.lower().split())
-
-            if not words_a or not words_b:
-                return False
-
-            # 计算词重叠率
-            overlap = len(words_a & words_b) / min(len(words_a), len(words_b))
+            # 计算词重叠率（按规范顺序查缓存，与阈值无关）
+            if title_b < title_a:
+                title_a, title_b = title_b, title_a
+            overlap = _title_overlap(title_a, title_b)
             
             return overlap > threshold
             
         except Exception as e:
-            self.logger.error(f"判断相似性时出错: {e}", exc_info=True)
+            self.logger.error(f"判断相似性时出错: {e}")
             return False
     
-    def merge_similar_news(self, news_list: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    def merge_similar_news(
+        self,
+        news_list: List[Dict[str, Any]],
+        validated: bool = False
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
         """
         合并相似的新闻，防止重复展示。
         
         按顺序遍历新闻列表，如果与已有新闻相似则跳过，否则添加。
+        用词倒排索引找出至少有一个公共词的已保留新闻（重叠率 > 0 的必要条件），
+        只对这些候选做精确相似判断，避免 O(N²) 两两比较。
+        （不用 MinHash/LSH 剪枝：LSH 估计的是 Jaccard 相似度，而这里按重叠率判断，
+        短标题被长标题包含时重叠率高、Jaccard 低，会漏掉应合并的新闻。）
         
         Args:
             news_list: 新闻字典列表
+            validated: 输入是否已经过 validate_news_item（均为含字符串 title 的字典），
+                为 True 时跳过逐条的类型和字段检查
             
         Returns:
             tuple: (merged_list, stats_dict)
@@ -251,37 +305,87 @@ class SearchResultProcessor:
             self.logger.error(f"阈值必须在 0-1 之间，但收到 {self.similarity_threshold}")
             raise ValueError(f"阈值必须在 0-1 之间，但收到 {self.similarity_threshold}")
         
+        # 少于 2 条时不存在可合并的新闻对，有效输入原样返回，跳过索引构建和逐条循环
+        if len(news_list) < 2 and (
+            validated or all(isinstance(news, dict) and "title" in news for news in news_list)
+        ):
+            return list(news_list), {
+                "input_count": len(news_list),
+                "output_count": len(news_list),
+                "merged_count": 0,
+                "dedup_ratio": 0.0 if news_list else 0
+            }
+        
         merged = []
+        # 与 merged 一一对应的标题词数（公共词数由倒排表计数得到），每条新闻只分词一次，
+        # 内层比较不再经过 is_similar 的类型检查和异常处理
+        kept_sizes: List[int] = []
+        threshold = self.similarity_threshold
+        debug = self.logger.isEnabledFor(logging.DEBUG)  # 关闭 DEBUG 时循环内不构造日志字符串
         merged_count = 0  # 合并掉的新闻数
+        # 词 -> 含该词的已保留新闻下标（精确候选分块）
+        token_index: Dict[str, List[int]] = {}
+        # 词集合 -> 已保留新闻下标：词集合完全相同时重叠率为 1，一次哈希查找即可判定相似
+        exact_kept: Dict[frozenset, int] = {}
+        exact_match = threshold < 1
+        # 热循环中用到的全局函数和绑定方法预先取为局部变量
+        title_tokens = _title_tokens
+        get_postings = token_index.get
         
         try:
             for idx, news in enumerate(news_list, 1):
                 try:
-                    if not isinstance(news, dict):
-                        self.logger.warning(f"[{idx}] 条目不是字典类型，跳过: {type(news)}")
-                        continue
-                    
-                    if "title" not in news:
-                        self.logger.warning(f"[{idx}] 条目缺少 title 字段，跳过")
-                        continue
+                    if not validated:
+                        if not isinstance(news, dict):
+                            self.logger.warning(f"[{idx}] 条目不是字典类型，跳过: {type(news)}")
+                            continue
+                        
+                        if "title" not in news:
+                            self.logger.warning(f"[{idx}] 条目缺少 title 字段，跳过")
+                            continue
                     
-                    title = str(news["title"])
+                    title = news["title"]
+                    # 非字符串标题在 is_similar 中视为不相似：比较时按 str 分词，但保留时记为空词集合
+                    title_is_str = validated or isinstance(title, str)
+                    if not title_is_str:
+                        title = str(title)
+                    tokens = title_tokens(title)
+                    n_tokens = len(tokens)
                     found_similar = False
                     
-                    # 检查是否与已有新闻相似
-                    for m_idx, m in enumerate(merged, 1):
-                        if self.is_similar(title, m["title"]):
-                            self.logger.debug(f"[{idx}] 新闻与第 {m_idx} 条相似，跳过")
-                            found_similar = True
-                            merged_count += 1
-                            break
+                    # 候选 (已保留下标, 公共词数)，按保留顺序产生；
+                    # 词集合与某条已保留新闻完全相同时只检查该条
+                    if exact_match and tokens in exact_kept:
+                        overlaps = ((exact_kept[tokens], n_tokens),)
+                    else:
+                        # 倒排表计数即公共词数（Counter 的计数循环在 C 中完成），无需逐对求交
+                        shared = Counter(chain.from_iterable(get_postings(token, ()) for token in tokens))
+                        overlaps = ((m_pos, shared[m_pos]) for m_pos in sorted(shared))
+                    
+                    # 检查是否与已有新闻相似（词重叠率，与 is_similar 判断一致）
+                    if n_tokens:
+                        for m_pos, inter in overlaps:
+                            if inter / min(n_tokens, kept_sizes[m_pos]) > threshold:
+                                if debug:
+                                    self.logger.debug(f"[{idx}] 新闻与第 {m_pos + 1} 条相似，跳过")
+                                found_similar = True
+                                merged_count += 1
+                                break
                     
                     if not found_similar:
+                        pos = len(merged)
                         merged.append(news)
-                        self.logger.debug(f"[{idx}] ✓ 添加新闻: {title[:50]}...")
+                        kept_sizes.append(n_tokens if title_is_str else 0)
+                        if exact_match and n_tokens and title_is_str:
+                            exact_kept[tokens] = pos
+                        if title_is_str:
+                            for token in tokens:
+                                token_index.setdefault(token, []).append(pos)
+                        if debug:
+                            self.logger.debug(f"[{idx}] ✓ 添加新闻: {title[:50]}...")
                         
                 except Exception as e:
-                    self.logger.error(f"[{idx}] 处理条目时出错: {e}", exc_info=True)
+                    self.logger.error(f"[{idx}] 处理条目时出错: {e}")
                     continue
             
             stats = {
@@ -362,6 +466,21 @@ class SearchResultProcessor:
             raise
 
 
+# 函数式接口复用的处理器实例，按 (max_items, similarity_threshold) 缓存（处理器除配置外无状态）
+_PROCESSORS: Dict[Tuple[int, float], SearchResultProcessor] = {}
+
+
+def _get_processor(max_items: int = 10, similarity_threshold: float = 0.6) -> SearchResultProcessor:
+    """获取（必要时创建）指定配置的共享处理器"""
+    key = (max_items, similarity_threshold)
+    processor = _PROCESSORS.get(key)
+    if processor is None:
+        processor = _PROCESSORS.setdefault(
+            key, SearchResultProcessor(max_items=max_items, similarity_threshold=similarity_threshold)
+        )
+    return processor
+
+
 def normalize_news(raw_news: List[Dict[str, Any]], max_items: int = 10) -> Tuple[List[Dict], Dict]:
     """
     函数式接口：规范化新闻数据
@@ -373,8 +492,7 @@ def normalize_news(raw_news: List[Dict[str, Any]], max_items: int = 10) -> Tuple
     Returns:
         tuple: (normalized_list, stats_dict)
     """
-    processor = SearchResultProcessor(max_items=max_items)
-    return processor.normalize_news(raw_news)
+    return _get_processor(max_items=max_items).normalize_news(raw_news)
 
 
 def deduplicate_news(news_list: List[Dict]) -> Tuple[List[Dict], Dict]:
@@ -387,8 +505,7 @@ def deduplicate_news(news_list: List[Dict]) -> Tuple[List[Dict], Dict]:
     Returns:
         tuple: (dedup_news, dedup_stats)
     """
-    processor = SearchResultProcessor()
-    return processor.deduplicate_news(news_list)
+    return _get_processor().deduplicate_news(news_list)
 
 
 def merge_similar_news(news_list: List[Dict[str, Any]], threshold: float = 0.6) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
@@ -402,8 +519,7 @@ def merge_similar_news(news_list: List[Dict[str, Any]], threshold: float = 0.6)
     Returns:
         tuple: (merged_list, stats_dict)
     """
-    processor = SearchResultProcessor(similarity_threshold=threshold)
-    return processor.merge_similar_news(news_list)
+    return _get_processor(similarity_threshold=threshold).merge_similar_news(news_list)
 
 
 def process_search_results(raw_news: List[Dict], top_k: int = 5) -> Tuple[List[Dict], Dict]:
@@ -417,8 +533,7 @@ def process_search_results(raw_news: List[Dict], top_k: int = 5) -> Tuple[List[D
     Returns:
         tuple: (processed_news, pipeline_stats)
     """
-    processor = SearchResultProcessor()
-    return processor.process_search_results(raw_news)
+    return _get_processor().process_search_results(raw_news)
 
 
 def main():
@@ -7,6 +7,7 @@
 """
 
 import logging
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import Dict, Any, List
 
@@ -14,29 +15,45 @@ logger = logging.getLogger(__name__)
 
 
 # Tier 1 公司列表（高重要性）
-TIER1_COMPANIES = {
+TIER1_COMPANIES = frozenset({
     "OpenAI", "Microsoft", "Google", "Anthropic", "Meta", "Amazon",
     "NVIDIA", "Apple", "Tesla", "Alibaba", "Tencent", "ByteDance",
     "Baidu", "DeepMind", "Cohere", "Stability AI", "Midjourney"
-}
+})
 
 # Tier 1 新闻源（高可信度）
-TIER1_SOURCES = {
+TIER1_SOURCES = frozenset({
     "Financial Times", "Bloomberg", "Reuters", "The Wall Street Journal",
     "The Economist", "TechCrunch", "The Information"
-}
+})
 
 # 高紧迫性信号
-URGENT_SIGNALS = {
+URGENT_SIGNALS = frozenset({
     "earnings", "regulation", "acquisition", "product_commercial",
     "funding", "partnership", "layoff"
-}
+})
 
 # 创新信号
-INNOVATION_SIGNALS = {
+INNOVATION_SIGNALS = frozenset({
     "product_commercial", "product_prototype", "research_breakthrough",
     "algorithm_improvement"
-}
+})
+
+# 投资评级查找表：综合得分达到 RATING_THRESHOLDS[i] 时升到 RATING_LABELS[i + 1]
+RATING_THRESHOLDS = (45, 65, 80)
+RATING_LABELS = ("Pass", "Risk Alert", "Monitor", "Strong Buy Signal")
+
+# 竞争相关关键词（行业影响条目中出现即视为竞争影响）
+COMPETITIVE_KEYWORDS = (
+    "竞争", "市场份额", "份额", "对手", "替代",
+    "挑战", "威胁", "优势", "护城河"
+)
+
+# 创新关键词（标题或正文前 500 字出现即加分）
+INNOVATION_KEYWORDS = (
+    "breakthrough", "revolutionary", "novel", "first", "new model",
+    "突破", "革命", "首次", "新模型", "创新"
+)
 
 
 @dataclass
@@ -90,289 +107,248 @@ class InvestmentScorer:
             "innovation": 0.10,       # 创新度
         }
 
-    def calculate_scorecard(self, news: Dict[str, Any]) -> InvestmentScorecard:
+    def calculate_scorecard(self, news: Dict[str, Any], collect_reasoning: bool = True) -> InvestmentScorecard:
         """
         计算7D评分卡
 
+        各维度在同一次遍历中计算：新闻中的 investment_info、signals、companies、
+        investment_thesis 等字段只读取一次，供所有维度共用。
+
         Args:
             news: 新闻数据字典
+            collect_reasoning: 是否生成各维度的文字说明；只需要分数时传 False，
+                跳过说明字符串的构造，reasoning 为空字典
 
         Returns:
             InvestmentScorecard: 评分卡对象
         """
-        scorecard = InvestmentScorecard()
-        reasoning = {}
+        investment_info = news.get("investment_info", {})
+        signals = news.get("signals", [])
+        companies = news.get("companies", [])
+        industry_impact = investment_info.get("industry_impact", [])
+        thesis = investment_info.get("investment_thesis", {})
+        if not isinstance(thesis, dict):
+            thesis = None
 
         # 1. 重要性评分（Materiality）
-        materiality, mat_reason = self._calculate_materiality(news)
-        scorecard.materiality_score = materiality
-        reasoning["materiality"] = mat_reason
-
-        # 2. 紧迫性评分（Urgency）
-        urgency, urg_reason = self._calculate_urgency(news)
-        scorecard.urgency_score = urgency
-        reasoning["urgency"] = urg_reason
-
-        # 3. 确信度评分（Conviction）
-        conviction, conv_reason = self._calculate_conviction(news)
-        scorecard.conviction_score = conviction
-        reasoning["conviction"] = conv_reason
-
-        # 4. 竞争影响评分（Competitive）
-        competitive, comp_reason = self._calculate_competitive(news)
-        scorecard.competitive_score = competitive
-        reasoning["competitive"] = comp_reason
-
-        # 5. 风险评分（Risk）
-        risk, risk_reason = self._calculate_risk(news)
-        scorecard.risk_score = risk
-        reasoning["risk"] = risk_reason
-
-        # 6. 创新度评分（Innovation）
-        innovation, innov_reason = self._calculate_innovation(news)
-        scorecard.innovation_score = innovation
-        reasoning["innovation"] = innov_reason
-
-        # 7. 执行力评分（Execution）- 暂时使用默认值
-        execution = 5.0
-        scorecard.execution_score = execution
-        reasoning["execution"] = "基于历史执行记录（默认中等）"
-
-        # 计算综合得分（0-100）
-        composite = (
-            materiality * self.weights["materiality"] +
-            urgency * self.weights["urgency"] +
-            conviction * self.weights["conviction"] +
-            competitive * self.weights["competitive"] +
-            (10 - risk) * self.weights["risk"] +  # 风险反向计分
-            innovation * self.weights["innovation"]
-        ) * 10  # 缩放到0-100
-
-        scorecard.composite_score = composite
-        scorecard.reasoning = reasoning
-
-        # 确定投资评级
-        if composite >= 80:
-            scorecard.investment_rating = "Strong Buy Signal"
-        elif composite >= 65:
-            scorecard.investment_rating = "Monitor"
-        elif composite >= 45:
-            scorecard.investment_rating = "Risk Alert"
-        else:
-            scorecard.investment_rating = "Pass"
-
-        return scorecard
-
-    def _calculate_materiality(self, news: Dict[str, Any]) -> tuple:
-        """计算重要性评分"""
-        score = 0.0
+        materiality = 0.0
         reasons = []
 
-        # 检查投资信息维度
-        investment_info = news.get("investment_info", {})
-
         # 有数字信息 +3
         numbers = investment_info.get("numbers", [])
         if numbers:
-            score += min(len(numbers) * 1.5, 3.0)
-            reasons.append(f"包含{len(numbers)}个数字信息")
+            materiality += min(len(numbers) * 1.5, 3.0)
+            if collect_reasoning:
+                reasons.append(f"包含{len(numbers)}个数字信息")
 
         # 有商业化信息 +3
         business = investment_info.get("business", [])
         if business:
-            score += min(len(business) * 1.5, 3.0)
-            reasons.append(f"包含{len(business)}个商业信息")
+            materiality += min(len(business) * 1.5, 3.0)
+            if collect_reasoning:
+                reasons.append(f"包含{len(business)}个商业信息")
 
-        # 涉及Tier 1公司 +4
-        companies = news.get("companies", [])
-        tier1_companies = [c for c in companies if c in TIER1_COMPANIES]
-        if tier1_companies:
-            score += 4.0
-            reasons.append(f"涉及顶级公司: {', '.join(tier1_companies)}")
+        # 涉及Tier 1公司 +4（先用 isdisjoint 判断有无交集，有命中时再按原顺序收集用于说明）
+        if companies and not TIER1_COMPANIES.isdisjoint(companies):
+            materiality += 4.0
+            if collect_reasoning:
+                tier1_companies = [c for c in companies if c in TIER1_COMPANIES]
+                reasons.append(f"涉及顶级公司: {', '.join(tier1_companies)}")
 
         # 有行业影响 +2
-        industry_impact = investment_info.get("industry_impact", [])
         if industry_impact:
-            score += 2.0
-            reasons.append(f"行业影响: {len(industry_impact)}条")
+            materiality += 2.0
+            if collect_reasoning:
+                reasons.append(f"行业影响: {len(industry_impact)}条")
 
-        score = min(score, 10.0)
-        reason_text = "; ".join(reasons) if reasons else "无明显重要信息"
+        materiality = min(materiality, 10.0)
+        mat_reason = "; ".join(reasons) if reasons else "无明显重要信息"
 
-        return score, reason_text
-
-    def _calculate_urgency(self, news: Dict[str, Any]) -> tuple:
-        """计算紧迫性评分"""
-        score = 0.0
+        # 2. 紧迫性评分（Urgency）
+        urgency = 0.0
         reasons = []
 
-        # 检查信号类型
-        signals = news.get("signals", [])
-
         # 高紧迫性信号
-        urgent_signals = [s for s in signals if s in URGENT_SIGNALS]
-        if urgent_signals:
-            score += min(len(urgent_signals) * 3.5, 7.0)
-            reasons.append(f"紧急信号: {', '.join(urgent_signals)}")
+        if signals and not URGENT_SIGNALS.isdisjoint(signals):
+            urgent_signals = [s for s in signals if s in URGENT_SIGNALS]
+            urgency += min(len(urgent_signals) * 3.5, 7.0)
+            if collect_reasoning:
+                reasons.append(f"紧急信号: {', '.join(urgent_signals)}")
 
         # 有管理层表态 +2
-        investment_info = news.get("investment_info", {})
-        management_claims = investment_info.get("management_claims", [])
-        if management_claims:
-            score += 2.0
-            reasons.append("包含管理层表态")
+        if investment_info.get("management_claims", []):
+            urgency += 2.0
+            if collect_reasoning:
+                reasons.append("包含管理层表态")
 
         # 有时间周期信息 +1
-        thesis = investment_info.get("investment_thesis", {})
-        if isinstance(thesis, dict):
+        if thesis is not None:
             time_horizon = thesis.get("time_horizon", "")
             if time_horizon in ["即时", "1-3个月"]:
-                score += 1.0
-                reasons.append(f"时间敏感: {time_horizon}")
-
-        score = min(score, 10.0)
-        reason_text = "; ".join(reasons) if reasons else "无明显时间敏感性"
+                urgency += 1.0
+                if collect_reasoning:
+                    reasons.append(f"时间敏感: {time_horizon}")
 
-        return score, reason_text
+        urgency = min(urgency, 10.0)
+        urg_reason = "; ".join(reasons) if reasons else "无明显时间敏感性"
 
-    def _calculate_conviction(self, news: Dict[str, Any]) -> tuple:
-        """计算确信度评分"""
-        score = 0.0
+        # 3. 确信度评分（Conviction）
+        conviction = 0.0
         reasons = []
 
         # 来源可信度
         source = news.get("source", "")
         if any(tier1 in source for tier1 in TIER1_SOURCES):
-            score += 5.0
-            reasons.append(f"顶级来源: {source}")
+            conviction += 5.0
+            if collect_reasoning:
+                reasons.append(f"顶级来源: {source}")
         else:
-            score += 2.0
-            reasons.append(f"一般来源: {source}")
+            conviction += 2.0
+            if collect_reasoning:
+                reasons.append(f"一般来源: {source}")
 
         # 有引用 +3
-        light_features = news.get("light_features", {})
-        if light_features.get("has_quote"):
-            score += 3.0
-            reasons.append("包含直接引用")
+        if news.get("light_features", {}).get("has_quote"):
+            conviction += 3.0
+            if collect_reasoning:
+                reasons.append("包含直接引用")
 
         # 有具体事实 +2
-        investment_info = news.get("investment_info", {})
         facts = investment_info.get("facts", [])
         if facts:
-            score += 2.0
-            reasons.append(f"包含{len(facts)}个事实")
+            conviction += 2.0
+            if collect_reasoning:
+                reasons.append(f"包含{len(facts)}个事实")
 
-        score = min(score, 10.0)
-        reason_text = "; ".join(reasons) if reasons else "证据不足"
+        conviction = min(conviction, 10.0)
+        conv_reason = "; ".join(reasons) if reasons else "证据不足"
 
-        return score, reason_text
-
-    def _calculate_competitive(self, news: Dict[str, Any]) -> tuple:
-        """计算竞争影响评分"""
-        score = 0.0
+        # 4. 竞争影响评分（Competitive）
+        competitive = 0.0
         reasons = []
 
-        investment_info = news.get("investment_info", {})
-        industry_impact = investment_info.get("industry_impact", [])
-
-        # 有行业影响信息
+        # 有行业影响信息时检查竞争相关关键词
         if industry_impact:
-            # 检查竞争相关关键词
-            competitive_keywords = [
-                "竞争", "市场份额", "份额", "对手", "替代",
-                "挑战", "威胁", "优势", "护城河"
-            ]
-
             competitive_items = [
                 item for item in industry_impact
-                if any(keyword in item for keyword in competitive_keywords)
+                if any(keyword in item for keyword in COMPETITIVE_KEYWORDS)
             ]
 
             if competitive_items:
-                score += min(len(competitive_items) * 3.0, 7.0)
-                reasons.append(f"竞争影响: {len(competitive_items)}条")
+                competitive += min(len(competitive_items) * 3.0, 7.0)
+                if collect_reasoning:
+                    reasons.append(f"竞争影响: {len(competitive_items)}条")
 
         # 涉及多个公司 = 可能的竞争动态
-        companies = news.get("companies", [])
         if len(companies) >= 2:
-            score += 3.0
-            reasons.append(f"涉及多家公司: {len(companies)}家")
+            competitive += 3.0
+            if collect_reasoning:
+                reasons.append(f"涉及多家公司: {len(companies)}家")
 
-        score = min(score, 10.0)
-        reason_text = "; ".join(reasons) if reasons else "无明显竞争影响"
+        competitive = min(competitive, 10.0)
+        comp_reason = "; ".join(reasons) if reasons else "无明显竞争影响"
 
-        return score, reason_text
-
-    def _calculate_risk(self, news: Dict[str, Any]) -> tuple:
-        """计算风险评分（越高风险越大）"""
-        score = 0.0
+        # 5. 风险评分（Risk，越高风险越大）
+        risk = 0.0
         reasons = []
 
-        investment_info = news.get("investment_info", {})
-        uncertainties = investment_info.get("uncertainties", [])
-
         # 不确定性数量
+        uncertainties = investment_info.get("uncertainties", [])
         if uncertainties:
-            score += min(len(uncertainties) * 2.0, 8.0)
-            reasons.append(f"不确定性: {len(uncertainties)}条")
+            risk += min(len(uncertainties) * 2.0, 8.0)
+            if collect_reasoning:
+                reasons.append(f"不确定性: {len(uncertainties)}条")
 
         # Bear case 数量
-        thesis = investment_info.get("investment_thesis", {})
-        if isinstance(thesis, dict):
+        if thesis is not None:
             bear_case = thesis.get("bear_case", [])
             if len(bear_case) >= 2:
-                score += 2.0
-                reasons.append(f"看跌理由: {len(bear_case)}条")
-
-        score = min(score, 10.0)
-        reason_text = "; ".join(reasons) if reasons else "风险较低"
+                risk += 2.0
+                if collect_reasoning:
+                    reasons.append(f"看跌理由: {len(bear_case)}条")
 
-        return score, reason_text
+        risk = min(risk, 10.0)
+        risk_reason = "; ".join(reasons) if reasons else "风险较低"
 
-    def _calculate_innovation(self, news: Dict[str, Any]) -> tuple:
-        """计算创新度评分"""
-        score = 0.0
+        # 6. 创新度评分（Innovation）
+        innovation = 0.0
         reasons = []
 
-        # 检查信号类型
-        signals = news.get("signals", [])
-        innovation_signals = [s for s in signals if s in INNOVATION_SIGNALS]
+        if signals and not INNOVATION_SIGNALS.isdisjoint(signals):
+            innovation_signals = [s for s in signals if s in INNOVATION_SIGNALS]
+            innovation += min(len(innovation_signals) * 4.0, 8.0)
+            if collect_reasoning:
+                reasons.append(f"创新信号: {', '.join(innovation_signals)}")
 
-        if innovation_signals:
-            score += min(len(innovation_signals) * 4.0, 8.0)
-            reasons.append(f"创新信号: {', '.join(innovation_signals)}")
-
-        # 检查是否有产品/技术相关关键词
+        # 检查是否有产品/技术相关关键词（只查标题和正文前 500 字）
         title = news.get("title", "").lower()
-        content = news.get("content", "").lower()
-
-        innovation_keywords = [
-            "breakthrough", "revolutionary", "novel", "first", "new model",
-            "突破", "革命", "首次", "新模型", "创新"
-        ]
+        content_head = news.get("content", "")[:500].lower()
+        if any(keyword in title or keyword in content_head for keyword in INNOVATION_KEYWORDS):
+            innovation += 2.0
+            if collect_reasoning:
+                reasons.append("包含创新关键词")
 
-        if any(keyword in title or keyword in content[:500] for keyword in innovation_keywords):
-            score += 2.0
-            reasons.append("包含创新关键词")
+        innovation = min(innovation, 10.0)
+        innov_reason = "; ".join(reasons) if reasons else "无明显创新"
 
-        score = min(score, 10.0)
-        reason_text = "; ".join(reasons) if reasons else "无明显创新"
-
-        return score, reason_text
+        # 7. 执行力评分（Execution）- 暂时使用默认值
+        execution = 5.0
 
+        # 计算综合得分（0-100）
+        weights = self.weights
+        composite = (
+            materiality * weights["materiality"] +
+            urgency * weights["urgency"] +
+            conviction * weights["conviction"] +
+            competitive * weights["competitive"] +
+            (10 - risk) * weights["risk"] +  # 风险反向计分
+            innovation * weights["innovation"]
+        ) * 10  # 缩放到0-100
 
-def calculate_investment_scorecard(news: Dict[str, Any]) -> InvestmentScorecard:
+        # 确定投资评级（按阈值表查找，代替逐级比较）
+        rating = RATING_LABELS[bisect_right(RATING_THRESHOLDS, composite)]
+
+        return InvestmentScorecard(
+            materiality_score=materiality,
+            urgency_score=urgency,
+            conviction_score=conviction,
+            competitive_score=competitive,
+            risk_score=risk,
+            innovation_score=innovation,
+            execution_score=execution,
+            composite_score=composite,
+            investment_rating=rating,
+            reasoning={
+                "materiality": mat_reason,
+                "urgency": urg_reason,
+                "conviction": conv_reason,
+                "competitive": comp_reason,
+                "risk": risk_reason,
+                "innovation": innov_reason,
+                "execution": "基于历史执行记录（默认中等）",
+            } if collect_reasoning else {},
+        )
+
+
+# 便捷函数复用的评分器（评分器只持有权重配置，可安全共享）
+_default_scorer = None
+
+
+def calculate_investment_scorecard(news: Dict[str, Any], collect_reasoning: bool = True) -> InvestmentScorecard:
     """
     便捷函数：计算投资评分卡
 
     Args:
         news: 新闻数据字典
+        collect_reasoning: 是否生成各维度的文字说明
 
     Returns:
         InvestmentScorecard: 评分卡对象
     """
-    scorer = InvestmentScorer()
-    return scorer.calculate_scorecard(news)
+    global _default_scorer
+    if _default_scorer is None:
+        _default_scorer = InvestmentScorer()
+    return _default_scorer.calculate_scorecard(news, collect_reasoning)
 
 
 if __name__ == "__main__":
@@ -8,9 +8,21 @@
 """
 
 from typing import List, Dict, Any, Tuple
+import heapq
 import re
 import logging
 
+# 可选依赖：Aho-Corasick 多模式匹配（未安装时回退到逐个关键词子串查找）
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 预编译正则：是否包含数字。原模式 \$?\d+(\.\d+)? 能匹配当且仅当文本中有数字，
+# 只需判断有无时直接查找单个数字即可，结果相同且不做多余的回溯和分组
+_NUM_RE = re.compile(r"\d")
+
 
 class NewsSelectorPipeline:
     """新闻选择器管道类，统一管理新闻评分和选择流程"""
@@ -45,6 +57,9 @@ class NewsSelectorPipeline:
         }
     }
 
+    # 事件 -> 分数（评分时直接查表，不再逐个访问 EVENT_RULES[e]["score"]）
+    EVENT_SCORES = {event: rule["score"] for event, rule in EVENT_RULES.items()}
+
     # ===============================
     # 2. 重点公司（投资权重）
     # ===============================
@@ -88,6 +103,8 @@ class NewsSelectorPipeline:
         """
         self.top_k = top_k
         self.logger = self._setup_logger()
+        if AHOCORASICK_AVAILABLE and NewsSelectorPipeline._automaton is None:
+            NewsSelectorPipeline._automaton = self._build_automaton()
 
     def _setup_logger(self) -> logging.Logger:
         """设置日志记录器"""
@@ -100,19 +117,74 @@ class NewsSelectorPipeline:
             logger.setLevel(logging.DEBUG)
         return logger
 
+    # 所有关键词编译成的 Aho-Corasick 自动机（类级别共享，首次实例化时构建）
+    _automaton = None
+
+    @classmethod
+    def _build_automaton(cls):
+        """
+        将事件关键词、重点公司、PR 和观点模式编译为一个 Aho-Corasick 自动机
+
+        每个关键词的值为 ((类别, 标识), ...)，同一关键词可属于多个类别。
+        """
+        entries: Dict[str, List[Tuple[str, str]]] = {}
+        for event, rule in cls.EVENT_RULES.items():
+            for keyword in rule["keywords"]:
+                entries.setdefault(keyword, []).append(("event", event))
+        for company in cls.IMPORTANT_COMPANIES:
+            entries.setdefault(company, []).append(("company", company))
+        for pattern in cls.PR_PATTERNS:
+            entries.setdefault(pattern, []).append(("pr", pattern))
+        for pattern in cls.OPINION_PATTERNS:
+            entries.setdefault(pattern, []).append(("opinion", pattern))
+
+        automaton = ahocorasick.Automaton()
+        for keyword, payload in entries.items():
+            automaton.add_word(keyword, tuple(payload))
+        automaton.make_automaton()
+        return automaton
+
+    def _scan(self, text: str) -> Tuple[List[str], List[str], bool, bool]:
+        """
+        一次扫描文本，得到 (事件, 重点公司, 是否 PR, 是否观点)
+
+        安装 pyahocorasick 时对文本做一次线性扫描（含重叠匹配，与子串查找结果一致）；
+        否则逐个关键词查找。事件按 EVENT_RULES 顺序、公司按 IMPORTANT_COMPANIES 迭代顺序返回。
+
+        Args:
+            text: 已转小写的文本
+        """
+        if self._automaton is None:
+            # 未安装 pyahocorasick 时逐个关键词做子串查找
+            return (
+                self._detect_events(text),
+                self._detect_companies(text),
+                self._contains_any(text, self.PR_PATTERNS),
+                self._contains_any(text, self.OPINION_PATTERNS),
+            )
+
+        # 先对命中的关键词去重（一篇文章中同一关键词常出现多次），再展开类别
+        payloads = {payload for _, payload in self._automaton.iter(text)}
+        if not payloads:
+            # 大多数非投资类新闻不含任何关键词，直接返回空结果
+            return [], [], False, False
+        found = {item for payload in payloads for item in payload}
+        events = [e for e in self.EVENT_RULES if ("event", e) in found]
+        companies = [c for c in self.IMPORTANT_COMPANIES if ("company", c) in found]
+        kinds = {kind for kind, _ in found}
+        return events, companies, "pr" in kinds, "opinion" in kinds
+
     def _contains_any(self, text: str, patterns: List[str]) -> bool:
-        """检查文本是否包含任何指定模式"""
+        """检查文本（调用方已转小写）是否包含任何指定模式"""
         try:
-            text = text.lower()
             return any(p in text for p in patterns)
         except Exception as e:
             self.logger.error(f"检查文本模式时出错: {e}", exc_info=True)
             return False
 
     def _detect_events(self, text: str) -> List[str]:
-        """检测文本中的投资事件"""
+        """检测文本（调用方已转小写）中的投资事件"""
         try:
-            text = text.lower()
             matched = []
             for event, rule in self.EVENT_RULES.items():
                 if any(k in text for k in rule["keywords"]):
@@ -123,9 +195,8 @@ class NewsSelectorPipeline:
             return []
 
     def _detect_companies(self, text: str) -> List[str]:
-        """检测文本中提及的重点公司"""
+        """检测文本（调用方已转小写）中提及的重点公司"""
         try:
-            text = text.lower()
             return [c for c in self.IMPORTANT_COMPANIES if c in text]
         except Exception as e:
             self.logger.error(f"检测公司时出错: {e}", exc_info=True)
@@ -133,11 +204,7 @@ class NewsSelectorPipeline:
 
     def _has_numbers(self, text: str) -> bool:
         """检查文本是否包含数字（可量化信息）"""
-        try:
-            return bool(re.search(r"\$?\d+(\.\d+)?", text))
-        except Exception as e:
-            self.logger.error(f"检测数字时出错: {e}", exc_info=True)
-            return False
+        return _NUM_RE.search(text) is not None
 
     def _score_light_features(self, news: Dict[str, Any]) -> float:
         """
@@ -189,38 +256,39 @@ class NewsSelectorPipeline:
 
     def _score_news(self, news: Dict[str, Any]) -> Dict[str, Any]:
         """
-        对单条新闻进行投资评分
+        对单条新闻进行投资评分（不修改传入的新闻字典）
 
         Args:
             news: 新闻字典
 
         Returns:
-            包含评分结果的新闻字典
+            评分字段：investment_score、signals、companies、light_feature_score
         """
         try:
             score = 0.0
-            signals = []
 
             title = news.get("title", "")
             # 兼容两种字段名：summary 或 content
             summary = news.get("summary", news.get("content", ""))
             text = f"{title} {summary}".lower()
 
+            # 事件、公司、PR、观点关键词一次扫描得到
+            events, companies, has_pr, has_opinion = self._scan(text)
+
             # --- PR / 观点直接降权 ---
-            if self._contains_any(text, self.PR_PATTERNS):
+            if has_pr:
                 score -= 2.0
 
-            if self._contains_any(text, self.OPINION_PATTERNS):
+            if has_opinion:
                 score -= 1.5
 
-            # --- 事件评分 ---
-            events = self._detect_events(text)
+            # --- 事件评分（命中的事件即信号，按 EVENT_RULES 顺序） ---
+            event_scores = self.EVENT_SCORES
             for e in events:
-                score += self.EVENT_RULES[e]["score"]
-                signals.append(e)
+                score += event_scores[e]
+            signals = events
 
             # --- 公司加权 ---
-            companies = self._detect_companies(text)
             if companies:
                 score += 1.5
 
@@ -239,25 +307,27 @@ class NewsSelectorPipeline:
             light_feature_score = self._score_light_features(news)
             score += light_feature_score
 
-            news["investment_score"] = round(score, 2)
-            news["signals"] = signals
-            news["companies"] = companies
-            news["light_feature_score"] = light_feature_score
-
-            self.logger.debug(
-                f"新闻评分完成 - 标题: {title[:50]}..., "
-                f"分数: {score}, 信号: {signals}, "
-                f"轻量化特征分: {light_feature_score}"
-            )
-            return news
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"新闻评分完成 - 标题: {title[:50]}..., "
+                    f"分数: {score}, 信号: {signals}, "
+                    f"轻量化特征分: {light_feature_score}"
+                )
+            return {
+                "investment_score": round(score, 2),
+                "signals": signals,
+                "companies": companies,
+                "light_feature_score": light_feature_score,
+            }
 
         except Exception as e:
             self.logger.error(f"评分新闻时出错: {e}", exc_info=True)
-            news["investment_score"] = 0.0
-            news["signals"] = []
-            news["companies"] = []
-            news["light_feature_score"] = 0.0
-            return news
+            return {
+                "investment_score": 0.0,
+                "signals": [],
+                "companies": [],
+                "light_feature_score": 0.0,
+            }
 
     def select_news(self, news_list: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
@@ -303,18 +373,34 @@ class NewsSelectorPipeline:
             # 步骤1：评分
             self.logger.info(f"\n【步骤1】评分 - 处理 {len(news_list)} 条新闻")
             self.logger.info(f"其中 {light_features_count} 条带有轻量化特征")
+            # 分数统计（总分、过滤数、分数分布）在评分循环中一并累计，无需再遍历。
+            # scored 保存 (原新闻, 评分字段)，只为最终选中的 top_k 条合并出新字典，不再逐条复制
             scored = []
+            score_sum = 0.0
+            dropped_count = 0
+            score_ranges = {"<0": 0, "0-0.5": 0, "0.5-1": 0, ">1": 0}
+            debug = self.logger.isEnabledFor(logging.DEBUG)  # 关闭 DEBUG 时逐条评分循环内不构造日志字符串
             for idx, n in enumerate(news_list, 1):
                 try:
                     if not isinstance(n, dict):
                         self.logger.warning(f"[{idx}] 条目不是字典类型，跳过")
                         continue
-                    scored_item = self._score_news(n.copy())
-                    scored.append(scored_item)
-                    self.logger.debug(
-                        f"[{idx}] ✓ {scored_item.get('title', '未知')[:40]}... "
-                        f"分数: {scored_item.get('investment_score', 0)}"
-                    )
+                    fields = self._score_news(n)
+                    scored.append((n, fields))
+                    s = fields["investment_score"]
+                    score_sum += s
+                    if s <= 0:
+                        dropped_count += 1
+                    if s < 0:
+                        score_ranges["<0"] += 1
+                    elif s <= 0.5:
+                        score_ranges["0-0.5"] += 1
+                    elif s <= 1:
+                        score_ranges["0.5-1"] += 1
+                    else:
+                        score_ranges[">1"] += 1
+                    if debug:
+                        self.logger.debug(f"[{idx}] ✓ {n.get('title', '未知')[:40]}... 分数: {s}")
                 except Exception as e:
                     self.logger.error(f"[{idx}] 评分失败: {e}", exc_info=True)
                     continue
@@ -325,35 +411,23 @@ class NewsSelectorPipeline:
 
             self.logger.info(f"评分完成 - 共评分 {len(scored)} 条")
 
-            # 步骤2：排序
-            self.logger.info(f"\n【步骤2】排序")
-            scored.sort(key=lambda x: x["investment_score"], reverse=True)
-            scores = [n.get("investment_score", 0) for n in scored]
-            avg_score = sum(scores) / len(scores) if scores else 0
+            avg_score = score_sum / len(scored)
             stats["average_score"] = round(avg_score, 2)
-            self.logger.info(f"排序完成 - 平均分数: {stats['average_score']}")
-
-            # 步骤3：选择和过滤
-            self.logger.info(f"\n【步骤3】选择前 {self.top_k} 条（过滤分数 <= 0）")
-            selected = [n for n in scored if n["investment_score"] > 0][:self.top_k]
-            dropped = [n for n in scored if n["investment_score"] <= 0]
+            self.logger.info(f"平均分数: {stats['average_score']}")
+
+            # 步骤2-3：选择和过滤。只需要前 top_k 条，用堆选取（O(N log k)）代替整表排序；
+            # heapq.nlargest 等价于稳定的 sorted(..., reverse=True)[:k]，同分时保持输入顺序
+            self.logger.info(f"\n【步骤2】选择前 {self.top_k} 条（过滤分数 <= 0）")
+            top = heapq.nlargest(
+                self.top_k,
+                (item for item in scored if item[1]["investment_score"] > 0),
+                key=lambda item: item[1]["investment_score"],
+            )
+            selected = [{**n, **fields} for n, fields in top]
 
             stats["selected_count"] = len(selected)
-            stats["dropped_count"] = len(dropped)
+            stats["dropped_count"] = dropped_count
             stats["output_count"] = len(selected)
-
-            # 分数分布统计
-            score_ranges = {"<0": 0, "0-0.5": 0, "0.5-1": 0, ">1": 0}
-            for n in scored:
-                s = n.get("investment_score", 0)
-                if s < 0:
-                    score_ranges["<0"] += 1
-                elif s <= 0.5:
-                    score_ranges["0-0.5"] += 1
-                elif s <= 1:
-                    score_ranges["0.5-1"] += 1
-                else:
-                    score_ranges[">1"] += 1
             stats["score_distribution"] = score_ranges
 
             self.logger.info(f"选择完成 - 选中: {stats['selected_count']} 条，过滤: {stats['dropped_count']} 条")
@@ -14,16 +14,25 @@ from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# 尝试导入orjson（未安装时回退到标准库 json）
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class WebDataExporter:
     """H5 应用数据导出器"""
 
-    def __init__(self, output_dir: Optional[str] = None):
+    def __init__(self, output_dir: Optional[str] = None, pretty: Optional[bool] = None):
         """
         初始化导出器
 
         Args:
             output_dir: 输出目录，默认为 webapp/data
+            pretty: 是否输出带缩进的 JSON（便于本地调试），默认读取环境变量
+                WEBAPP_PRETTY_JSON（"1" 为开启），未设置时输出紧凑 JSON
         """
         if output_dir is None:
             # 默认输出到 webapp/data 目录
@@ -31,6 +40,16 @@ class WebDataExporter:
             output_dir = os.path.join(base_dir, "webapp", "data")
 
         self.output_dir = output_dir
+        if pretty is None:
+            pretty = os.getenv("WEBAPP_PRETTY_JSON", "0") == "1"
+        self.pretty = pretty
+        # 批量模式下暂存的索引项 {日期: 索引项}，None 表示未处于批量模式
+        self._pending: Optional[Dict[str, Dict[str, Any]]] = None
+        # 最近一次读写的索引内容及对应文件的 (mtime_ns, size)，文件未被外部修改时免去重复解析
+        self._index_cache: Optional[Dict[str, Any]] = None
+        self._index_stat: Optional[tuple] = None
+        # 索引文件路径固定，初始化时拼接一次；输出目录也只在初始化时创建
+        self.index_file = os.path.join(self.output_dir, "index.json")
         os.makedirs(self.output_dir, exist_ok=True)
         logger.info(f"WebDataExporter 初始化，输出目录: {self.output_dir}")
 
@@ -52,20 +71,23 @@ class WebDataExporter:
         }
 
         try:
-            date_str = result.get("date", datetime.now().strftime("%Y-%m-%d"))
+            # 每次导出只取一次当前时间，日期缺省值和索引的 last_updated 共用
+            now = datetime.now()
+            date_str = result["date"] if "date" in result else now.strftime("%Y-%m-%d")
 
             # 1. 导出当天的详细数据
             data_file = self._export_daily_data(result, date_str)
             export_result["data_file"] = data_file
 
             # 2. 更新索引文件
-            index_file = self._update_index(result, date_str)
+            index_file = self._update_index(result, date_str, now)
             export_result["index_file"] = index_file
 
             export_result["success"] = True
             logger.info(f"数据导出成功: {data_file}")
 
         except Exception as e:
+            # 每次导出至多触发一次，保留完整堆栈便于排查
             logger.error(f"数据导出失败: {e}", exc_info=True)
             export_result["error"] = str(e)
 
@@ -83,14 +105,13 @@ class WebDataExporter:
             str: 导出的文件路径
         """
         # 文件名格式: 20260120.json
-        filename = date_str.replace("-", "") + ".json"
+        filename = f"{date_str.replace('-', '')}.json"
         file_path = os.path.join(self.output_dir, filename)
 
         # 处理数据，移除过大的字段
         export_data = self._prepare_export_data(result)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, ensure_ascii=False, indent=2)
+        self._dump_json(export_data, file_path)
 
         return file_path
 
@@ -104,33 +125,24 @@ class WebDataExporter:
         Returns:
             dict: 处理后的数据
         """
-        export_data = {
-            "date": result.get("date", ""),
-            "news": [],
-            "events": []
-        }
+        simplify = self._simplify_investment_info
 
-        # 处理新闻列表
-        for news in result.get("news", []):
-            news_item = {
+        # 处理新闻列表（有投资信息时追加简化后的 investment_info）
+        news_items = [
+            {
                 "title": news.get("title", ""),
                 "url": news.get("url", ""),
                 "source": news.get("source", ""),
                 "published_at": news.get("published_at", ""),
                 "ai_summary": news.get("ai_summary", ""),
+                **({"investment_info": simplify(news["investment_info"])} if news.get("investment_info") else {}),
             }
-
-            # 投资信息
-            if news.get("investment_info"):
-                news_item["investment_info"] = self._simplify_investment_info(
-                    news.get("investment_info", {})
-                )
-
-            export_data["news"].append(news_item)
+            for news in result.get("news", [])
+        ]
 
         # 处理事件列表
-        for event in result.get("events", []):
-            event_item = {
+        event_items = [
+            {
                 "representative_title": event.get("representative_title", ""),
                 "summary": event.get("summary", ""),
                 "news_count": event.get("news_count", 0),
@@ -139,9 +151,14 @@ class WebDataExporter:
                 "news_indices": event.get("news_indices", []),
                 "decision": event.get("decision", {})
             }
-            export_data["events"].append(event_item)
+            for event in result.get("events", [])
+        ]
 
-        return export_data
+        return {
+            "date": result.get("date", ""),
+            "news": news_items,
+            "events": event_items
+        }
 
     def _simplify_investment_info(self, info: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -162,28 +179,20 @@ class WebDataExporter:
             "confidence_level": info.get("confidence_level", "")
         }
 
-    def _update_index(self, result: Dict[str, Any], date_str: str) -> str:
+    def _update_index(self, result: Dict[str, Any], date_str: str, now: Optional[datetime] = None) -> str:
         """
         更新索引文件，记录所有可用的日期数据
 
+        批量模式下（见 begin_batch）只把索引项暂存，在 commit_batch 时统一写入。
+
         Args:
             result: 分析结果
             date_str: 日期字符串
+            now: 本次导出的时间，用作 last_updated（默认取当前时间）
 
         Returns:
             str: 索引文件路径
         """
-        index_file = os.path.join(self.output_dir, "index.json")
-
-        # 读取现有索引
-        index_data = {"articles": [], "last_updated": ""}
-        if os.path.exists(index_file):
-            try:
-                with open(index_file, "r", encoding="utf-8") as f:
-                    index_data = json.load(f)
-            except Exception:
-                pass
-
         # 构建当天的索引项
         events = result.get("events", [])
         top_events = []
@@ -201,32 +210,188 @@ class WebDataExporter:
             "topEvents": top_events
         }
 
-        # 更新或添加索引项
-        articles = index_data.get("articles", [])
-        existing_index = next(
-            (i for i, a in enumerate(articles) if a.get("date") == date_str),
-            None
-        )
+        if self._pending is not None:
+            self._pending[date_str] = article_item
+            return self.index_file
 
-        if existing_index is not None:
-            articles[existing_index] = article_item
+        return self._write_index([article_item], now)
+
+    def _write_index(self, article_items: List[Dict[str, Any]], now: Optional[datetime] = None) -> str:
+        """
+        读取索引文件，合并索引项后写回（一次读、一次写）
+
+        Args:
+            article_items: 要更新或添加的索引项
+            now: 写入 last_updated 的时间（默认取当前时间）
+
+        Returns:
+            str: 索引文件路径
+        """
+        index_file = self.index_file
+
+        # 读取现有索引（浅拷贝，下面只替换字段，不修改缓存中的列表）
+        index_data = dict(self._read_index())
+
+        articles = index_data.get("articles", [])
+        if all(article_item in articles for article_item in article_items):
+            # 索引中已有完全相同的索引项（重复导出未变化的数据），不改写索引和 last_updated
+            return index_file
+
+        if len(article_items) == 1 and (not articles or article_items[0]["date"] > articles[0].get("date", "")):
+            # 最常见的情况：导出的日期比索引中所有日期都新（索引按日期降序写入，
+            # YYYY-MM-DD 字符串比较即时间先后），直接放到最前面，无需合并和排序
+            index_data["articles"] = [article_items[0]] + articles[:29]
         else:
-            articles.insert(0, article_item)  # 新数据插入到最前面
+            # 按日期建表后更新或添加索引项（同一日期只保留一项）
+            by_date = {a.get("date", ""): a for a in articles}
+            for article_item in article_items:
+                by_date[article_item["date"]] = article_item
 
-        # 按日期排序（降序）
-        articles.sort(key=lambda x: x.get("date", ""), reverse=True)
+            # 按日期排序（降序），保留最近30天的数据。日期键各不相同，直接对键排序，无需 key 函数
+            index_data["articles"] = [by_date[d] for d in sorted(by_date, reverse=True)[:30]]
 
-        # 保留最近30天的数据
-        articles = articles[:30]
+        index_data["last_updated"] = (now or datetime.now()).isoformat()
 
-        index_data["articles"] = articles
-        index_data["last_updated"] = datetime.now().isoformat()
+        self._dump_json(index_data, index_file)
 
-        with open(index_file, "w", encoding="utf-8") as f:
-            json.dump(index_data, f, ensure_ascii=False, indent=2)
+        # 写入成功后更新缓存，下次导出无需重新解析
+        st = os.stat(index_file)
+        self._index_cache = index_data
+        self._index_stat = (st.st_mtime_ns, st.st_size)
 
         return index_file
 
+    def _read_index(self) -> Dict[str, Any]:
+        """
+        读取索引文件；文件的修改时间和大小与上次读写时一致时直接返回内存中的缓存
+
+        Returns:
+            dict: 索引数据（文件不存在或无法解析时为空索引）
+        """
+        try:
+            st = os.stat(self.index_file)
+        except FileNotFoundError:
+            return {"articles": [], "last_updated": ""}
+
+        index_stat = (st.st_mtime_ns, st.st_size)
+        if self._index_cache is not None and index_stat == self._index_stat:
+            return self._index_cache
+
+        try:
+            index_data = self._load_json(self.index_file)
+        except Exception:
+            return {"articles": [], "last_updated": ""}
+
+        self._index_cache = index_data
+        self._index_stat = index_stat
+        return index_data
+
+    def begin_batch(self) -> None:
+        """
+        进入批量模式：之后的 export 只写当天数据文件，索引项暂存到 commit_batch 时统一写入
+        """
+        if self._pending is None:
+            self._pending = {}
+
+    def commit_batch(self) -> str:
+        """
+        退出批量模式，将暂存的索引项一次性合并写入索引文件
+
+        Returns:
+            str: 索引文件路径（没有暂存项时不写文件）
+        """
+        pending, self._pending = self._pending, None
+        if not pending:
+            return self.index_file
+        return self._write_index(list(pending.values()))
+
+    def export_many(self, results: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """
+        批量导出多天的分析结果，索引文件只读写一次
+
+        Args:
+            results: 分析结果列表
+
+        Returns:
+            list: 每个结果对应的导出结果
+        """
+        self.begin_batch()
+        try:
+            return [self.export(result) for result in results]
+        finally:
+            self.commit_batch()
+
+    def _dump_json(self, data: Dict[str, Any], path: str) -> bool:
+        """
+        将数据写入 JSON 文件（UTF-8；文件供前端解析，默认紧凑输出，pretty 时缩进 2 格）
+
+        安装 orjson 时直接序列化为字节串，否则使用标准库 json；整体序列化后一次写入
+        同目录的临时文件并 fsync，再用 os.replace 原子替换目标文件，
+        前端读取时不会看到写了一半的文件，写入中途出错也不会破坏原文件。
+        已有文件内容与序列化结果完全相同时（如重复导出同一天）不再写入。
+
+        Args:
+            data: 要写入的数据
+            path: 文件路径
+
+        Returns:
+            bool: 是否写入了文件
+        """
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS
+            if self.pretty:
+                option |= orjson.OPT_INDENT_2
+            payload = orjson.dumps(data, option=option)
+        elif self.pretty:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        else:
+            payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        if self._has_content(path, payload):
+            return False
+
+        tmp_path = path + ".tmp"
+        try:
+            # 默认缓冲即可：BufferedWriter 对超过缓冲区大小的单次写入直接下发，不经缓冲区分段
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return True
+
+    @staticmethod
+    def _has_content(path: str, payload: bytes) -> bool:
+        """检查文件内容是否与 payload 完全相同（先比较大小，大小一致时才读取比较）"""
+        try:
+            if os.stat(path).st_size != len(payload):
+                return False
+            with open(path, "rb") as f:
+                return f.read() == payload
+        except OSError:
+            return False
+
+    def _load_json(self, path: str) -> Dict[str, Any]:
+        """
+        读取 JSON 文件
+
+        Args:
+            path: 文件路径
+
+        Returns:
+            dict: 解析后的数据
+        """
+        if ORJSON_AVAILABLE:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
+
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
 
 def export_to_webapp(result: Dict[str, Any], stats: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
     """
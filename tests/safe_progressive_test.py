@@ -13,8 +13,12 @@
 import sys
 import os
 import time
+import atexit
 import logging
 import json
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # 添加项目路径
@@ -22,6 +26,33 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from search.concurrent_rss_fetcher import ConcurrentRSSFetcher
 from search.search_pipeline import SearchPipeline
+from search.http_client import get_session
+from search.rss_config import RSS_SOURCES
+
+# 可选依赖：psutil 用于监控系统资源（未安装时资源指标为 0）
+try:
+    import psutil
+    _HAS_PSUTIL = True
+    # 首次调用只初始化计数器；之后不带 interval 的调用立即返回距上次调用期间的 CPU 使用率，
+    # 测试前的采样反映上一阶段以来的负载，测试后的采样正好覆盖本次测试窗口
+    psutil.cpu_percent(interval=None)
+except ImportError:
+    _HAS_PSUTIL = False
+
+# 可选依赖：orjson 用于快速序列化报告（未安装时使用标准库 json）
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+_BYTES_PER_MB = 1024 * 1024
+
+# 并发级别阶梯：从 CONCURRENCY_START 起翻倍，直到 CONCURRENCY_MAX
+CONCURRENCY_START = 2
+CONCURRENCY_MAX = 64
+THROUGHPUT_PLATEAU_RATIO = 0.95  # 吞吐量低于上一级别的该比例时视为已过最优点
+CPU_LIMIT_PERCENT = 85  # 测试后 CPU 使用率超过该值时停止升级
 
 # 配置日志
 logging.basicConfig(
@@ -31,22 +62,69 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def use_queue_logging():
+    """
+    将根 logger 的输出移到后台线程
+
+    根 logger 只保留一个 QueueHandler（入队即返回），原有处理器由 QueueListener 在后台线程中
+    格式化并写出，计时阶段内的日志不会因 stderr 写入阻塞抓取线程。进程退出时停止并刷新队列。
+
+    Returns:
+        QueueListener: 已启动的监听器
+    """
+    root = logging.getLogger()
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
 def get_system_status():
-    """获取系统资源状态"""
-    try:
-        import psutil
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        return {
-            "cpu_percent": cpu_percent,
-            "memory_percent": memory.percent,
-            "memory_available_mb": memory.available / 1024 / 1024
-        }
-    except ImportError:
+    """获取系统资源状态（非阻塞采样）"""
+    if not _HAS_PSUTIL:
         return {"cpu_percent": 0, "memory_percent": 0, "memory_available_mb": 0}
 
+    memory = psutil.virtual_memory()
+    return {
+        "cpu_percent": psutil.cpu_percent(interval=None),
+        "memory_percent": memory.percent,
+        "memory_available_mb": memory.available / _BYTES_PER_MB
+    }
+
+
+def warmup_connections(timeout=5, workers=10):
+    """
+    预热：对所有 RSS 源发一次 HEAD 请求
+
+    各模式共用 http_client 的共享 Session，预热后每个主机的 DNS 解析和 TCP/TLS 连接
+    已完成，串行基准与各并发级别从相同的网络状态开始计时（否则先运行的串行基准
+    独自承担建连开销）。用 HEAD 而非 GET，不会写入 ETag 条件请求缓存。
+
+    Args:
+        timeout: 单个请求超时时间（秒）
+        workers: 预热线程数
+
+    Returns:
+        int: 预热成功的源数量
+    """
+    session = get_session()
+
+    def head(url):
+        try:
+            session.head(url, timeout=timeout, allow_redirects=True).close()
+            return True
+        except Exception:
+            return False
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        warmed = sum(executor.map(head, [source["url"] for source in RSS_SOURCES]))
+    logger.info(f"连接预热完成: {warmed}/{len(RSS_SOURCES)} 个源")
+    return warmed
+
 
-def safe_test_concurrent(max_concurrent, hours=24, max_items=3):
+def safe_test_concurrent(max_concurrent, hours=24, max_items=3, cooldown=3):
     """
     安全测试单个并发级别
 
@@ -54,6 +132,7 @@ def safe_test_concurrent(max_concurrent, hours=24, max_items=3):
         max_concurrent: 并发数
         hours: 搜索时间范围
         max_items: 每源最大条数（测试时用小值）
+        cooldown: 测试后等待系统恢复的秒数（最后一个级别传 0）
 
     Returns:
         dict: 测试结果
@@ -83,11 +162,14 @@ def safe_test_concurrent(max_concurrent, hours=24, max_items=3):
         "sys_status_before": sys_status
     }
 
-    start_time = time.time()
+    # 耗时用单调时钟计算（不受系统校时影响）；start_time 字段仍记录墙上时间供阅读
+    start_time = time.perf_counter()
 
     try:
         logger.info(f"开始测试 (并发={max_concurrent}, 每源最多{max_items}条)...")
 
+        # 抓取器通过 http_client 的进程内共享 Session 下载，各并发级别之间复用同一连接池，
+        # 无需为每个级别传入会话（后续级别的连接已建立，耗时对比时需注意这一点）
         fetcher = ConcurrentRSSFetcher(
             hours=hours,
             max_items_per_source=max_items,
@@ -97,7 +179,7 @@ def safe_test_concurrent(max_concurrent, hours=24, max_items=3):
 
         news, stats = fetcher.fetch_rss_sync()
 
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
 
         # 获取测试后的系统状态
         sys_status_after = get_system_status()
@@ -116,6 +198,11 @@ def safe_test_concurrent(max_concurrent, hours=24, max_items=3):
             result["successful_sources"] = perf.get("successful_fetches", 0)
             result["failed_sources"] = perf.get("failed_fetches", 0)
             result["avg_time_per_source"] = perf.get("avg_time_per_source", 0)
+            result["peak_concurrent"] = perf.get("peak_concurrent", 0)
+            result["max_source_latency"] = perf.get("max_source_latency", 0)
+            # 确认抓取器确实遵守并发上限，否则各级别的耗时对比没有意义
+            assert result["peak_concurrent"] <= max_concurrent, \
+                f"峰值并发 {result['peak_concurrent']} 超过上限 {max_concurrent}"
 
         logger.info(f"✓ 测试完成")
         logger.info(f"  - 耗时: {elapsed:.2f}s")
@@ -131,7 +218,7 @@ def safe_test_concurrent(max_concurrent, hours=24, max_items=3):
         raise
 
     except Exception as e:
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         logger.error(f"✗ 测试失败: {e}")
         result.update({
             "success": False,
@@ -140,12 +227,13 @@ def safe_test_concurrent(max_concurrent, hours=24, max_items=3):
         })
 
     # 等待系统恢复
-    time.sleep(3)
+    if cooldown:
+        time.sleep(cooldown)
 
     return result
 
 
-def test_serial_baseline(hours=24, max_items=3):
+def safe_test_serial(hours=24, max_items=3):
     """测试串行模式作为基准"""
     logger.info("=" * 70)
     logger.info("测试串行模式 (基准)")
@@ -162,7 +250,7 @@ def test_serial_baseline(hours=24, max_items=3):
         "sys_status_before": sys_status
     }
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         logger.info(f"开始测试 (串行模式, 每源最多{max_items}条)...")
@@ -170,7 +258,7 @@ def test_serial_baseline(hours=24, max_items=3):
         pipeline = SearchPipeline(hours=hours, max_items_per_source=max_items)
         news, stats = pipeline.search_recent_ai_news()
 
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         sys_status_after = get_system_status()
 
         result.update({
@@ -181,16 +269,17 @@ def test_serial_baseline(hours=24, max_items=3):
             "sys_status_after": sys_status_after
         })
 
-        # 提取成功/失败源数量
-        source_stats = stats.get("sources", {})
-        result["successful_sources"] = sum(
-            1 for s in source_stats.values()
-            if isinstance(s, dict) and s.get("valid_fetched", 0) > 0
-        )
-        result["failed_sources"] = sum(
-            1 for s in source_stats.values()
-            if isinstance(s, dict) and s.get("valid_fetched", 0) == 0
-        )
+        # 提取成功/失败源数量（一次遍历同时统计）
+        successful = failed = 0
+        for s in stats.get("sources", {}).values():
+            if isinstance(s, dict):
+                valid = s.get("valid_fetched", 0)
+                if valid > 0:
+                    successful += 1
+                elif valid == 0:
+                    failed += 1
+        result["successful_sources"] = successful
+        result["failed_sources"] = failed
 
         logger.info(f"✓ 测试完成")
         logger.info(f"  - 耗时: {elapsed:.2f}s")
@@ -198,7 +287,7 @@ def test_serial_baseline(hours=24, max_items=3):
         logger.info(f"  - 成功源: {result['successful_sources']}")
 
     except Exception as e:
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         logger.error(f"✗ 测试失败: {e}")
         result.update({
             "success": False,
@@ -212,54 +301,60 @@ def test_serial_baseline(hours=24, max_items=3):
 
 def generate_report(serial_result, concurrent_results):
     """生成性能对比报告"""
-    print("\n" + "=" * 80)
-    print("RSS并发抓取性能测试报告")
-    print("=" * 80)
-    print(f"测试时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"测试配置: 每源最多3条新闻 (安全测试)")
+    # 报告头、文件名和 test_time 使用同一时刻，三者保持一致
+    report_time = datetime.now()
+    # 报告各行先收集到列表，最后一次写入 stdout（输出重定向到日志文件时不再逐行 write）
+    out = []
+    out.append("\n" + "=" * 80)
+    out.append("RSS并发抓取性能测试报告")
+    out.append("=" * 80)
+    out.append(f"测试时间: {report_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    out.append(f"测试配置: 每源最多3条新闻 (安全测试)")
 
     # 串行模式结果
-    print("\n【串行模式 - 基准】")
-    print("-" * 80)
+    out.append("\n【串行模式 - 基准】")
+    out.append("-" * 80)
     if serial_result["success"]:
-        print(f"✓ 测试成功")
-        print(f"  耗时: {serial_result['elapsed_time']:.2f}s")
-        print(f"  获取新闻: {serial_result['news_count']} 条")
-        print(f"  成功源: {serial_result.get('successful_sources', 0)}")
-        print(f"  失败源: {serial_result.get('failed_sources', 0)}")
+        out.append(f"✓ 测试成功")
+        out.append(f"  耗时: {serial_result['elapsed_time']:.2f}s")
+        out.append(f"  获取新闻: {serial_result['news_count']} 条")
+        out.append(f"  成功源: {serial_result.get('successful_sources', 0)}")
+        out.append(f"  失败源: {serial_result.get('failed_sources', 0)}")
     else:
-        print(f"✗ 测试失败: {serial_result.get('error', '未知错误')}")
+        out.append(f"✗ 测试失败: {serial_result.get('error', '未知错误')}")
 
     # 并发模式结果
-    print("\n【并发模式测试】")
-    print("-" * 80)
-    print(f"{'并发数':<10} {'状态':<8} {'耗时(s)':<12} {'新闻数':<10} "
-          f"{'成功源':<10} {'加速比':<10}")
-    print("-" * 80)
+    out.append("\n【并发模式测试】")
+    out.append("-" * 80)
+    out.append(f"{'并发数':<10} {'状态':<8} {'耗时(s)':<12} {'新闻数':<10} "
+          f"{'成功源':<10} {'最慢源(s)':<12} {'加速比':<10}")
+    out.append("-" * 80)
 
     serial_time = serial_result.get('elapsed_time', 0)
 
     for result in concurrent_results:
         if result["success"]:
             speedup = serial_time / result['elapsed_time'] if result['elapsed_time'] > 0 else 0
-            print(f"{result['max_concurrent']:<10} "
+            out.append(f"{result['max_concurrent']:<10} "
                   f"{'✓':<8} "
                   f"{result['elapsed_time']:<12.2f} "
                   f"{result['news_count']:<10} "
                   f"{result.get('successful_sources', 0):<10} "
+                  f"{result.get('max_source_latency', 0):<12.2f} "
                   f"{speedup:<10.2f}x")
         else:
             error = result.get('error', '未知')[:20]
-            print(f"{result['max_concurrent']:<10} "
+            out.append(f"{result['max_concurrent']:<10} "
                   f"{'✗':<8} "
                   f"{'-':<12} "
                   f"{'-':<10} "
                   f"{'-':<10} "
+                  f"{'-':<12} "
                   f"{error}")
 
     # 性能对比分析
-    print("\n【性能对比分析】")
-    print("-" * 80)
+    out.append("\n【性能对比分析】")
+    out.append("-" * 80)
 
     successful_tests = [r for r in concurrent_results if r["success"]]
     if successful_tests and serial_result["success"]:
@@ -268,62 +363,73 @@ def generate_report(serial_result, concurrent_results):
         improvement = (serial_time - best_result['elapsed_time']) / serial_time * 100
         speedup = serial_time / best_result['elapsed_time']
 
-        print(f"最佳并发配置: {best_result['max_concurrent']}")
-        print(f"串行耗时: {serial_time:.2f}s")
-        print(f"并发耗时: {best_result['elapsed_time']:.2f}s")
-        print(f"性能提升: {improvement:.1f}%")
-        print(f"加速比: {speedup:.2f}x")
-        print(f"节省时间: {serial_time - best_result['elapsed_time']:.2f}s")
+        out.append(f"最佳并发配置: {best_result['max_concurrent']}")
+        out.append(f"串行耗时: {serial_time:.2f}s")
+        out.append(f"并发耗时: {best_result['elapsed_time']:.2f}s")
+        out.append(f"性能提升: {improvement:.1f}%")
+        out.append(f"加速比: {speedup:.2f}x")
+        out.append(f"节省时间: {serial_time - best_result['elapsed_time']:.2f}s")
 
     # 系统资源分析
-    print("\n【系统资源使用】")
-    print("-" * 80)
+    out.append("\n【系统资源使用】")
+    out.append("-" * 80)
     for result in concurrent_results:
         if result["success"]:
             before = result.get("sys_status_before", {})
             after = result.get("sys_status_after", {})
-            print(f"并发={result['max_concurrent']}: "
+            out.append(f"并发={result['max_concurrent']}: "
                   f"CPU {before.get('cpu_percent', 0):.1f}%→{after.get('cpu_percent', 0):.1f}%, "
                   f"内存 {before.get('memory_percent', 0):.1f}%→{after.get('memory_percent', 0):.1f}%")
 
     # 建议
-    print("\n【建议】")
-    print("-" * 80)
+    out.append("\n【建议】")
+    out.append("-" * 80)
     if successful_tests:
         best_concurrent = best_result['max_concurrent']
         if improvement > 50:
-            print(f"✓ 并发模式显著提升性能，推荐使用 max_concurrent={best_concurrent}")
+            out.append(f"✓ 并发模式显著提升性能，推荐使用 max_concurrent={best_concurrent}")
         elif improvement > 30:
-            print(f"✓ 并发模式有明显提升，建议使用 max_concurrent={best_concurrent}")
+            out.append(f"✓ 并发模式有明显提升，建议使用 max_concurrent={best_concurrent}")
         else:
-            print(f"○ 并发模式有小幅提升，可选择使用 max_concurrent={best_concurrent}")
+            out.append(f"○ 并发模式有小幅提升，可选择使用 max_concurrent={best_concurrent}")
     else:
-        print("✗ 所有并发测试失败，建议检查网络环境或使用串行模式")
+        out.append("✗ 所有并发测试失败，建议检查网络环境或使用串行模式")
+
+    out.append("\n" + "=" * 80)
 
-    print("\n" + "=" * 80)
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
     # 保存报告到文件
-    report_file = f"performance_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    report_file = f"performance_report_{report_time.strftime('%Y%m%d_%H%M%S')}.json"
     report_data = {
-        "test_time": datetime.now().isoformat(),
+        "test_time": report_time.isoformat(),
         "serial_result": serial_result,
         "concurrent_results": concurrent_results
     }
 
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(report_data, f, indent=2, ensure_ascii=False)
+    # orjson 直接输出 UTF-8 字节串（等价于 ensure_ascii=False），整体一次写入
+    if _HAS_ORJSON:
+        payload = orjson.dumps(report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        with open(report_file, 'wb') as f:
+            f.write(payload)
+    else:
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(report_data, f, indent=2, ensure_ascii=False)
 
     print(f"\n详细报告已保存到: {report_file}")
 
 
 def main():
     """主测试流程"""
+    use_queue_logging()
+
     print("=" * 80)
     print("安全的渐进式并发测试")
     print("=" * 80)
     print("\n配置:")
     print("  - 测试规模: 每源最多3条新闻 (安全测试)")
-    print("  - 并发级别: 2, 5, 10")
+    print(f"  - 并发级别: 从 {CONCURRENCY_START} 起逐级翻倍，最高 {CONCURRENCY_MAX}（吞吐量不再提升时停止）")
     print("  - 超时时间: 15秒/请求")
     print("  - 自动监控系统资源")
     print("\n⚠️  测试期间请勿关闭窗口")
@@ -337,40 +443,49 @@ def main():
     }
 
     try:
+        # 预热连接，使基准与并发测试在相同网络状态下计时
+        warmup_connections()
+
         # 测试1: 串行模式（基准）
         print("\n" + "=" * 80)
         print("第1步: 测试串行模式（作为基准）")
         print("=" * 80)
-        results["serial"] = test_serial_baseline(hours=24, max_items=3)
+        results["serial"] = safe_test_serial(hours=24, max_items=3)
 
         if not results["serial"]["success"]:
             logger.error("串行模式测试失败，停止后续测试")
             return
 
-        # 测试2: 低并发 (2)
-        print("\n" + "=" * 80)
-        print("第2步: 测试低并发 (并发数=2)")
-        print("=" * 80)
-        result = safe_test_concurrent(max_concurrent=2, hours=24, max_items=3)
-        results["concurrent"].append(result)
-
-        if not result["success"]:
-            logger.warning("低并发测试失败，停止后续测试")
-        else:
-            # 测试3: 中并发 (5)
+        # 各并发级别依次执行：并行运行会争用同一批 RSS 源和本机带宽，测得的耗时与加速比失真。
+        # 并发数从 CONCURRENCY_START 起逐级翻倍，失败、吞吐量不再提升或 CPU 超限时停止
+        max_concurrent = CONCURRENCY_START
+        prev_throughput = 0.0
+        step = 2
+        while max_concurrent <= CONCURRENCY_MAX:
             print("\n" + "=" * 80)
-            print("第3步: 测试中并发 (并发数=5)")
+            print(f"第{step}步: 测试并发 (并发数={max_concurrent})")
             print("=" * 80)
-            result = safe_test_concurrent(max_concurrent=5, hours=24, max_items=3)
+            is_last = max_concurrent * 2 > CONCURRENCY_MAX
+            result = safe_test_concurrent(
+                max_concurrent=max_concurrent, hours=24, max_items=3, cooldown=0 if is_last else 3
+            )
             results["concurrent"].append(result)
 
-            if result["success"]:
-                # 测试4: 标准并发 (10)
-                print("\n" + "=" * 80)
-                print("第4步: 测试标准并发 (并发数=10)")
-                print("=" * 80)
-                result = safe_test_concurrent(max_concurrent=10, hours=24, max_items=3)
-                results["concurrent"].append(result)
+            if not result["success"]:
+                logger.warning(f"并发={max_concurrent} 测试失败，停止后续测试")
+                break
+
+            throughput = result["news_count"] / result["elapsed_time"] if result["elapsed_time"] > 0 else 0.0
+            if prev_throughput and throughput < prev_throughput * THROUGHPUT_PLATEAU_RATIO:
+                logger.info(f"并发={max_concurrent} 吞吐量 {throughput:.2f} 条/s 低于上一级别，停止升级")
+                break
+            if result["sys_status_after"]["cpu_percent"] > CPU_LIMIT_PERCENT:
+                logger.warning(f"并发={max_concurrent} 时 CPU 超过 {CPU_LIMIT_PERCENT}%，停止升级")
+                break
+
+            prev_throughput = throughput
+            max_concurrent *= 2
+            step += 1
 
         # 生成报告
         generate_report(results["serial"], results["concurrent"])
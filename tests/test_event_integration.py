@@ -10,6 +10,7 @@ import ast
 import logging
 import os
 import sys
+import traceback
 
 # 添加 src 目录到 Python 路径
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -21,14 +22,14 @@ if SRC_DIR not in sys.path:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def test_basic_imports():
-    """测试基本导入功能"""
+def check_basic_imports():
+    """检查基本导入功能，返回是否全部通过（供脚本运行时决定退出码）"""
     print("=" * 50)
     print("开始测试Event模块基本导入功能")
     print("=" * 50)
     
     try:
-        # 1. 测试模块导入
+        # 1. 测试模块导入（导入本身即被测内容，保留在 try 中以便失败时打印原因而非收集阶段报错）
         print("\n1. 测试模块导入...")
         from event.event_pipeline import EventPipeline
         from event.clustering import NewsClusterer
@@ -60,16 +61,17 @@ def test_basic_imports():
         with open(main_file_path, 'r', encoding='utf-8') as f:
             main_code = f.read()
         
-        # 检查event相关导入
+        # 检查event相关导入（一次遍历语法树收集所有 event 模块导入，后续检查复用）
         tree = ast.parse(main_code)
-        has_event_import = False
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ImportFrom):
-                if node.module and 'event' in node.module:
-                    has_event_import = True
-                    print(f"✓ 检测到event模块导入: from {node.module} import {', '.join([alias.name for alias in node.names])}")
+        event_imports = {
+            node.module: [alias.name for alias in node.names]
+            for node in ast.walk(tree)
+            if isinstance(node, ast.ImportFrom) and node.module and 'event' in node.module
+        }
+        for module, names in event_imports.items():
+            print(f"✓ 检测到event模块导入: from {module} import {', '.join(names)}")
         
-        if has_event_import:
+        if event_imports:
             print("✓ main.py中event模块导入正常")
         else:
             print("⚠ 未检测到event模块导入")
@@ -88,11 +90,15 @@ def test_basic_imports():
         
     except Exception as e:
         print(f"\n❌ 测试失败: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
+def test_basic_imports():
+    """测试基本导入功能"""
+    assert check_basic_imports()
+
+
 if __name__ == "__main__":
-    success = test_basic_imports()
+    success = check_basic_imports()
     sys.exit(0 if success else 1)
\ No newline at end of file
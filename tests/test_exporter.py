@@ -6,10 +6,12 @@
 使用 AI 生成的 mock 数据进行测试，数据日期设为一年前（2025-01-21）
 """
 
+import copy
 import json
 import logging
 import os
 import sys
+import tempfile
 
 # 添加 src 目录到 Python 路径
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -17,7 +19,7 @@ SRC_DIR = os.path.join(PROJECT_ROOT, 'src')
 if SRC_DIR not in sys.path:
     sys.path.insert(0, SRC_DIR)
 
-from webapp_exporter import export_to_webapp
+from webapp_exporter import WebDataExporter, export_to_webapp
 
 # 配置日志
 logging.basicConfig(
@@ -27,6 +29,163 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# mock 分析结果（数据日期设为一年前）。模块加载时只构建一次，
+# 各测试通过 generate_mock_data() 取得深拷贝，可放心修改
+_MOCK_DATE = "2025-01-21"
+_MOCK_RESULT = {
+    "date": _MOCK_DATE,
+    "news": [
+        {
+            "title": "[Mock] OpenAI发布GPT-5预览版，多模态能力大幅提升",
+            "url": "https://mock.example.com/news/1",
+            "source": "TechCrunch",
+            "published_at": f"{_MOCK_DATE}T14:30:00Z",
+            "ai_summary": "OpenAI正式发布GPT-5预览版，新版本在多模态理解、推理能力和代码生成方面有显著提升，响应速度提高50%。",
+            "investment_info": {
+                "core_thesis": "大模型技术持续迭代，OpenAI保持行业领先地位",
+                "market_impact": "利好AI应用开发商和云计算厂商",
+                "risk_factors": ["竞争对手追赶速度加快", "商业化定价策略不确定"],
+                "time_horizon": "短期（3-6个月）",
+                "related_tickers": ["MSFT", "NVDA", "GOOGL"],
+                "confidence_level": "高"
+            }
+        },
+        {
+            "title": "[Mock] 英伟达H200芯片供不应求，产能扩张计划提前",
+            "url": "https://mock.example.com/news/2",
+            "source": "Reuters",
+            "published_at": f"{_MOCK_DATE}T10:15:00Z",
+            "ai_summary": "英伟达H200芯片需求远超预期，公司宣布与台积电合作提前扩产，预计2025年Q2产能将翻倍。",
+            "investment_info": {
+                "core_thesis": "AI算力需求持续爆发，英伟达硬件霸主地位稳固",
+                "market_impact": "利好半导体产业链，尤其是AI芯片和先进封装",
+                "risk_factors": ["地缘政治风险", "下游客户资本开支波动"],
+                "time_horizon": "中期（6-12个月）",
+                "related_tickers": ["NVDA", "TSM", "ASML"],
+                "confidence_level": "高"
+            }
+        },
+        {
+            "title": "[Mock] 特斯拉FSD V13正式推送，完全自动驾驶迈出关键一步",
+            "url": "https://mock.example.com/news/3",
+            "source": "Electrek",
+            "published_at": f"{_MOCK_DATE}T08:00:00Z",
+            "ai_summary": "特斯拉开始向北美用户推送FSD V13版本，新版本采用端到端神经网络，在复杂路况下表现显著提升。",
+            "investment_info": {
+                "core_thesis": "自动驾驶技术逐步成熟，特斯拉AI战略加速落地",
+                "market_impact": "利好自动驾驶产业链，特斯拉估值逻辑或将重塑",
+                "risk_factors": ["监管审批进度不确定", "安全事故风险"],
+                "time_horizon": "中长期（12-18个月）",
+                "related_tickers": ["TSLA", "MBLY", "QCOM"],
+                "confidence_level": "中"
+            }
+        },
+        {
+            "title": "[Mock] 字节跳动豆包大模型日活突破1亿",
+            "url": "https://mock.example.com/news/4",
+            "source": "36氪",
+            "published_at": f"{_MOCK_DATE}T16:00:00Z",
+            "ai_summary": "字节跳动旗下AI助手豆包日活用户突破1亿，成为国内增速最快的AI应用，C端变现模式逐步清晰。",
+            "investment_info": {
+                "core_thesis": "中国AI应用市场快速增长，字节跳动凭借流量优势领跑",
+                "market_impact": "加剧国内AI应用竞争，利好AI基础设施",
+                "risk_factors": ["用户增长可持续性待验证", "变现效率不确定"],
+                "time_horizon": "短期（3-6个月）",
+                "related_tickers": [],
+                "confidence_level": "中"
+            }
+        },
+        {
+            "title": "[Mock] 欧盟AI法案正式生效，全球AI监管进入新阶段",
+            "url": "https://mock.example.com/news/5",
+            "source": "BBC",
+            "published_at": f"{_MOCK_DATE}T12:00:00Z",
+            "ai_summary": "欧盟《人工智能法案》正式生效，对高风险AI应用设立严格合规要求，全球AI企业面临监管新挑战。",
+            "investment_info": {
+                "core_thesis": "AI监管趋严是长期趋势，合规成本将成为竞争壁垒",
+                "market_impact": "短期利空AI应用商，长期利好合规能力强的大厂",
+                "risk_factors": ["监管细则执行力度不确定", "可能引发其他地区跟进"],
+                "time_horizon": "长期（18-24个月）",
+                "related_tickers": ["META", "GOOGL", "MSFT"],
+                "confidence_level": "中"
+            }
+        }
+    ],
+    "events": [
+        {
+            "representative_title": "[Mock] OpenAI发布GPT-5预览版",
+            "summary": "OpenAI正式发布GPT-5预览版，在多模态理解、长上下文处理和推理能力方面实现重大突破。新版本响应速度提高50%，代码生成能力显著增强，有望推动AI应用开发进入新阶段。",
+            "news_count": 5,
+            "sources": ["TechCrunch", "The Verge", "Wired"],
+            "companies": ["OpenAI", "Microsoft"],
+            "news_indices": [0],
+            "decision": {
+                "importance": "high",
+                "signal": "positive",
+                "action": "buy",
+                "reasoning": "GPT-5是AI领域的标志性进展，将加速AI应用落地，利好微软等OpenAI投资方。"
+            }
+        },
+        {
+            "representative_title": "[Mock] 英伟达AI芯片需求持续火爆",
+            "summary": "英伟达H200芯片市场需求远超预期，公司与台积电合作提前扩产计划。数据中心客户排队抢购，交付周期延长至6个月以上，AI算力供需紧张局面短期难以缓解。",
+            "news_count": 4,
+            "sources": ["Reuters", "Bloomberg", "WSJ"],
+            "companies": ["NVIDIA", "TSMC", "AMD"],
+            "news_indices": [1],
+            "decision": {
+                "importance": "high",
+                "signal": "positive",
+                "action": "hold",
+                "reasoning": "AI芯片需求旺盛确认行业趋势，但当前估值已充分反映乐观预期。"
+            }
+        },
+        {
+            "representative_title": "[Mock] 特斯拉FSD V13技术突破",
+            "summary": "特斯拉FSD V13版本开始向北美用户推送，采用全新端到端神经网络架构，在城市复杂路况下的表现显著提升。分析师认为这是特斯拉向完全自动驾驶迈出的关键一步。",
+            "news_count": 3,
+            "sources": ["Electrek", "InsideEVs"],
+            "companies": ["Tesla", "Mobileye"],
+            "news_indices": [2],
+            "decision": {
+                "importance": "medium",
+                "signal": "positive",
+                "action": "watch",
+                "reasoning": "技术进步明显，但监管审批和大规模商用仍需时间验证。"
+            }
+        },
+        {
+            "representative_title": "[Mock] 中国AI应用市场爆发式增长",
+            "summary": "字节跳动豆包日活突破1亿，成为国内增速最快的AI应用。百度文心一言、阿里通义千问也在加速追赶，中国AI应用市场竞争进入白热化阶段。",
+            "news_count": 4,
+            "sources": ["36氪", "虎嗅", "界面新闻"],
+            "companies": ["字节跳动", "百度", "阿里巴巴"],
+            "news_indices": [3],
+            "decision": {
+                "importance": "medium",
+                "signal": "neutral",
+                "action": "watch",
+                "reasoning": "用户增长迅速但变现模式尚不清晰，需关注商业化进展。"
+            }
+        },
+        {
+            "representative_title": "[Mock] 全球AI监管框架逐步成形",
+            "summary": "欧盟《人工智能法案》正式生效，对高风险AI应用设立严格合规要求。美国、中国等主要经济体也在加速AI监管立法，全球AI行业进入规范发展新阶段。",
+            "news_count": 3,
+            "sources": ["BBC", "FT", "Reuters"],
+            "companies": ["Meta", "Google", "Microsoft"],
+            "news_indices": [4],
+            "decision": {
+                "importance": "medium",
+                "signal": "negative",
+                "action": "watch",
+                "reasoning": "监管趋严短期增加合规成本，但长期有利于行业健康发展。"
+            }
+        }
+    ]
+}
+
+
 def generate_mock_data() -> dict:
     """
     生成 mock 数据用于测试
@@ -34,165 +193,9 @@ def generate_mock_data() -> dict:
     数据日期设为一年前（2025-01-21）
 
     Returns:
-        dict: 模拟的分析结果
+        dict: 模拟的分析结果（_MOCK_RESULT 的深拷贝）
     """
-    # 使用一年前的日期
-    mock_date = "2025-01-21"
-
-    mock_result = {
-        "date": mock_date,
-        "news": [
-            {
-                "title": "[Mock] OpenAI发布GPT-5预览版，多模态能力大幅提升",
-                "url": "https://mock.example.com/news/1",
-                "source": "TechCrunch",
-                "published_at": f"{mock_date}T14:30:00Z",
-                "ai_summary": "OpenAI正式发布GPT-5预览版，新版本在多模态理解、推理能力和代码生成方面有显著提升，响应速度提高50%。",
-                "investment_info": {
-                    "core_thesis": "大模型技术持续迭代，OpenAI保持行业领先地位",
-                    "market_impact": "利好AI应用开发商和云计算厂商",
-                    "risk_factors": ["竞争对手追赶速度加快", "商业化定价策略不确定"],
-                    "time_horizon": "短期（3-6个月）",
-                    "related_tickers": ["MSFT", "NVDA", "GOOGL"],
-                    "confidence_level": "高"
-                }
-            },
-            {
-                "title": "[Mock] 英伟达H200芯片供不应求，产能扩张计划提前",
-                "url": "https://mock.example.com/news/2",
-                "source": "Reuters",
-                "published_at": f"{mock_date}T10:15:00Z",
-                "ai_summary": "英伟达H200芯片需求远超预期，公司宣布与台积电合作提前扩产，预计2025年Q2产能将翻倍。",
-                "investment_info": {
-                    "core_thesis": "AI算力需求持续爆发，英伟达硬件霸主地位稳固",
-                    "market_impact": "利好半导体产业链，尤其是AI芯片和先进封装",
-                    "risk_factors": ["地缘政治风险", "下游客户资本开支波动"],
-                    "time_horizon": "中期（6-12个月）",
-                    "related_tickers": ["NVDA", "TSM", "ASML"],
-                    "confidence_level": "高"
-                }
-            },
-            {
-                "title": "[Mock] 特斯拉FSD V13正式推送，完全自动驾驶迈出关键一步",
-                "url": "https://mock.example.com/news/3",
-                "source": "Electrek",
-                "published_at": f"{mock_date}T08:00:00Z",
-                "ai_summary": "特斯拉开始向北美用户推送FSD V13版本，新版本采用端到端神经网络，在复杂路况下表现显著提升。",
-                "investment_info": {
-                    "core_thesis": "自动驾驶技术逐步成熟，特斯拉AI战略加速落地",
-                    "market_impact": "利好自动驾驶产业链，特斯拉估值逻辑或将重塑",
-                    "risk_factors": ["监管审批进度不确定", "安全事故风险"],
-                    "time_horizon": "中长期（12-18个月）",
-                    "related_tickers": ["TSLA", "MBLY", "QCOM"],
-                    "confidence_level": "中"
-                }
-            },
-            {
-                "title": "[Mock] 字节跳动豆包大模型日活突破1亿",
-                "url": "https://mock.example.com/news/4",
-                "source": "36氪",
-                "published_at": f"{mock_date}T16:00:00Z",
-                "ai_summary": "字节跳动旗下AI助手豆包日活用户突破1亿，成为国内增速最快的AI应用，C端变现模式逐步清晰。",
-                "investment_info": {
-                    "core_thesis": "中国AI应用市场快速增长，字节跳动凭借流量优势领跑",
-                    "market_impact": "加剧国内AI应用竞争，利好AI基础设施",
-                    "risk_factors": ["用户增长可持续性待验证", "变现效率不确定"],
-                    "time_horizon": "短期（3-6个月）",
-                    "related_tickers": [],
-                    "confidence_level": "中"
-                }
-            },
-            {
-                "title": "[Mock] 欧盟AI法案正式生效，全球AI监管进入新阶段",
-                "url": "https://mock.example.com/news/5",
-                "source": "BBC",
-                "published_at": f"{mock_date}T12:00:00Z",
-                "ai_summary": "欧盟《人工智能法案》正式生效，对高风险AI应用设立严格合规要求，全球AI企业面临监管新挑战。",
-                "investment_info": {
-                    "core_thesis": "AI监管趋严是长期趋势，合规成本将成为竞争壁垒",
-                    "market_impact": "短期利空AI应用商，长期利好合规能力强的大厂",
-                    "risk_factors": ["监管细则执行力度不确定", "可能引发其他地区跟进"],
-                    "time_horizon": "长期（18-24个月）",
-                    "related_tickers": ["META", "GOOGL", "MSFT"],
-                    "confidence_level": "中"
-                }
-            }
-        ],
-        "events": [
-            {
-                "representative_title": "[Mock] OpenAI发布GPT-5预览版",
-                "summary": "OpenAI正式发布GPT-5预览版，在多模态理解、长上下文处理和推理能力方面实现重大突破。新版本响应速度提高50%，代码生成能力显著增强，有望推动AI应用开发进入新阶段。",
-                "news_count": 5,
-                "sources": ["TechCrunch", "The Verge", "Wired"],
-                "companies": ["OpenAI", "Microsoft"],
-                "news_indices": [0],
-                "decision": {
-                    "importance": "high",
-                    "signal": "positive",
-                    "action": "buy",
-                    "reasoning": "GPT-5是AI领域的标志性进展，将加速AI应用落地，利好微软等OpenAI投资方。"
-                }
-            },
-            {
-                "representative_title": "[Mock] 英伟达AI芯片需求持续火爆",
-                "summary": "英伟达H200芯片市场需求远超预期，公司与台积电合作提前扩产计划。数据中心客户排队抢购，交付周期延长至6个月以上，AI算力供需紧张局面短期难以缓解。",
-                "news_count": 4,
-                "sources": ["Reuters", "Bloomberg", "WSJ"],
-                "companies": ["NVIDIA", "TSMC", "AMD"],
-                "news_indices": [1],
-                "decision": {
-                    "importance": "high",
-                    "signal": "positive",
-                    "action": "hold",
-                    "reasoning": "AI芯片需求旺盛确认行业趋势，但当前估值已充分反映乐观预期。"
-                }
-            },
-            {
-                "representative_title": "[Mock] 特斯拉FSD V13技术突破",
-                "summary": "特斯拉FSD V13版本开始向北美用户推送，采用全新端到端神经网络架构，在城市复杂路况下的表现显著提升。分析师认为这是特斯拉向完全自动驾驶迈出的关键一步。",
-                "news_count": 3,
-                "sources": ["Electrek", "InsideEVs"],
-                "companies": ["Tesla", "Mobileye"],
-                "news_indices": [2],
-                "decision": {
-                    "importance": "medium",
-                    "signal": "positive",
-                    "action": "watch",
-                    "reasoning": "技术进步明显，但监管审批和大规模商用仍需时间验证。"
-                }
-            },
-            {
-                "representative_title": "[Mock] 中国AI应用市场爆发式增长",
-                "summary": "字节跳动豆包日活突破1亿，成为国内增速最快的AI应用。百度文心一言、阿里通义千问也在加速追赶，中国AI应用市场竞争进入白热化阶段。",
-                "news_count": 4,
-                "sources": ["36氪", "虎嗅", "界面新闻"],
-                "companies": ["字节跳动", "百度", "阿里巴巴"],
-                "news_indices": [3],
-                "decision": {
-                    "importance": "medium",
-                    "signal": "neutral",
-                    "action": "watch",
-                    "reasoning": "用户增长迅速但变现模式尚不清晰，需关注商业化进展。"
-                }
-            },
-            {
-                "representative_title": "[Mock] 全球AI监管框架逐步成形",
-                "summary": "欧盟《人工智能法案》正式生效，对高风险AI应用设立严格合规要求。美国、中国等主要经济体也在加速AI监管立法，全球AI行业进入规范发展新阶段。",
-                "news_count": 3,
-                "sources": ["BBC", "FT", "Reuters"],
-                "companies": ["Meta", "Google", "Microsoft"],
-                "news_indices": [4],
-                "decision": {
-                    "importance": "medium",
-                    "signal": "negative",
-                    "action": "watch",
-                    "reasoning": "监管趋严短期增加合规成本，但长期有利于行业健康发展。"
-                }
-            }
-        ]
-    }
-
-    return mock_result
+    return copy.deepcopy(_MOCK_RESULT)
 
 
 def test_exporter():
@@ -231,8 +234,9 @@ def test_exporter():
             logger.info("=" * 60)
             with open(data_file, "r", encoding="utf-8") as f:
                 exported_data = json.load(f)
-            print(json.dumps(exported_data, ensure_ascii=False, indent=2)[:2000])
-            if len(json.dumps(exported_data, ensure_ascii=False, indent=2)) > 2000:
+            preview = json.dumps(exported_data, ensure_ascii=False, indent=2)
+            print(preview[:2000])
+            if len(preview) > 2000:
                 print("\n... (内容过长，已截断)")
 
         # 读取并显示索引文件内容
@@ -241,14 +245,66 @@ def test_exporter():
             logger.info("\n" + "=" * 60)
             logger.info("索引文件内容")
             logger.info("=" * 60)
+            # 索引默认以紧凑格式写入（见 WEBAPP_PRETTY_JSON），原样输出只有一行，因此解析后缩进打印
             with open(index_file, "r", encoding="utf-8") as f:
                 index_data = json.load(f)
             print(json.dumps(index_data, ensure_ascii=False, indent=2))
     else:
         logger.error(f"\n❌ 导出失败: {export_result.get('error')}")
 
-    return export_result
+    assert export_result.get("success"), export_result.get("error")
+
+
+def test_export_many_matches_sequential_exports():
+    """测试批量导出与逐个导出得到相同的索引（批量时索引只读写一次）"""
+    mock_result = generate_mock_data()
+    results = [
+        dict(mock_result, date=date, events=mock_result["events"][:n])
+        for date, n in [("2025-01-05", 1), ("2025-01-03", 2), ("2025-01-09", 0), ("2025-01-03", 3)]
+    ]
+
+    with tempfile.TemporaryDirectory() as seq_dir, tempfile.TemporaryDirectory() as batch_dir:
+        exporter = WebDataExporter(seq_dir)
+        for result in results:
+            exporter.export(result)
+
+        batch_results = WebDataExporter(batch_dir).export_many(results)
+
+        with open(os.path.join(seq_dir, "index.json"), "r", encoding="utf-8") as f:
+            seq_index = json.load(f)
+        with open(os.path.join(batch_dir, "index.json"), "r", encoding="utf-8") as f:
+            batch_index = json.load(f)
+
+        assert all(r["success"] for r in batch_results)
+        assert batch_index["articles"] == seq_index["articles"]
+        assert [a["date"] for a in batch_index["articles"]] == ["2025-01-09", "2025-01-05", "2025-01-03"]
+        assert batch_index["articles"][2]["eventCount"] == min(3, len(mock_result["events"]))
+        assert sorted(os.listdir(batch_dir)) == sorted(os.listdir(seq_dir))
+
+
+def test_reexport_unchanged_result_skips_writes():
+    """测试重复导出未变化的数据时不改写数据文件和索引"""
+    mock_result = generate_mock_data()
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        exporter = WebDataExporter(output_dir)
+        first = exporter.export(mock_result)
+        mtimes = {p: os.stat(first[p]).st_mtime_ns for p in ("data_file", "index_file")}
+
+        second = exporter.export(mock_result)
+        assert second["success"]
+        # 导出不应修改传入的分析结果
+        assert mock_result == _MOCK_RESULT
+        assert {p: os.stat(second[p]).st_mtime_ns for p in ("data_file", "index_file")} == mtimes
+
+        changed = dict(mock_result, news=mock_result["news"][:1])
+        exporter.export(changed)
+        with open(first["index_file"], "r", encoding="utf-8") as f:
+            index_data = json.load(f)
+        assert index_data["articles"][0]["newsCount"] == 1
 
 
 if __name__ == "__main__":
     test_exporter()
+    test_export_many_matches_sequential_exports()
+    test_reexport_unchanged_result_skips_writes()
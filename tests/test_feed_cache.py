@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+feed_cache 单元测试
+
+覆盖 RSS 磁盘缓存的读写、无效缓存文件和写入失败时的清理。
+"""
+
+import gzip
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 添加 src 目录到 Python 路径
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(PROJECT_ROOT, 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import feedparser
+
+from search import feed_cache
+
+# 配置日志
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+URL = "https://example.com/feed.xml"
+
+
+def test_put_then_get_round_trip():
+    """测试写入后能读回 ETag/Last-Modified 和条目字段"""
+    published = time.struct_time((2026, 1, 19, 10, 0, 0, 0, 19, 0))
+    feed = feedparser.FeedParserDict(entries=[
+        feedparser.FeedParserDict(title="OpenAI 发布新模型", link="https://example.com/1",
+                                  published_parsed=published),
+    ])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        feed_cache.put(URL, '"etag-1"', "Mon, 19 Jan 2026 10:00:00 GMT", feed, cache_dir=Path(tmp))
+        etag, last_modified, cached = feed_cache.get(URL, cache_dir=Path(tmp))
+
+    assert etag == '"etag-1"'
+    assert last_modified == "Mon, 19 Jan 2026 10:00:00 GMT"
+    assert cached.entries[0]["title"] == "OpenAI 发布新模型"
+    assert cached.entries[0]["published_parsed"] == published
+
+
+def test_get_ignores_non_dict_payload():
+    """测试缓存文件是合法 JSON 但不是对象时视为无缓存"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = feed_cache._cache_path(URL, Path(tmp))
+        path.write_bytes(gzip.compress(b"[1, 2, 3]"))
+
+        assert feed_cache.get(URL, cache_dir=Path(tmp)) is None
+
+
+def test_put_removes_temp_file_on_failure():
+    """测试原子替换失败时不留下临时文件"""
+    feed = feedparser.FeedParserDict(entries=[feedparser.FeedParserDict(title="t", link="l")])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 目标路径被非空目录占用，os.replace 会失败
+        target = feed_cache._cache_path(URL, Path(tmp))
+        target.mkdir()
+        (target / "keep").write_text("x")
+
+        feed_cache.put(URL, '"etag-1"', None, feed, cache_dir=Path(tmp))
+
+        assert os.listdir(tmp) == [target.name]
+
+
+if __name__ == "__main__":
+    test_put_then_get_round_trip()
+    test_get_ignores_non_dict_payload()
+    test_put_removes_temp_file_on_failure()
+    print("✓ 所有测试通过")
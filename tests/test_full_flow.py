@@ -14,8 +14,9 @@ import logging
 import os
 import random
 import sys
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 # 添加 src 目录到 Python 路径
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -34,6 +35,10 @@ logger = logging.getLogger(__name__)
 # Mock 数据生成器
 # ============================================
 
+# Mock 流程专用的随机数生成器：由 iter_mock_rss_data 设定种子，
+# 不重置全局 random，也不受其他模块使用全局 random 的影响
+_rng = random.Random()
+
 # AI 投资新闻的主题模板
 NEWS_TEMPLATES = [
     # 融资类
@@ -209,6 +214,21 @@ PRODUCTS = [
     "AI 视频生成器", "多模态 AI 平台", "AI 搜索引擎", "智能分析平台"
 ]
 
+# Mock 投资信息与 Mock 事件中抽样使用的股票代码和头部公司
+TICKERS = ("NVDA", "MSFT", "GOOGL", "META", "AMZN", "AMD", "INTC")
+TOP_COMPANIES = tuple(COMPANIES[:10])
+
+# 固定的 Mock 日期（各条新闻在此基础上随机往前 0-7 天）
+MOCK_BASE_DATE = datetime(2026, 6, 6)
+MOCK_DATE_ISO = MOCK_BASE_DATE.strftime("%Y-%m-%d")      # 导出数据的日期
+MOCK_DATE_COMPACT = MOCK_BASE_DATE.strftime("%Y%m%d")    # 文章文件名中的日期
+# 往前 0-7 天只有 8 种日期，预先生成 (date, published_at) 字符串，按天数下标取用
+MOCK_DATE_STRINGS = tuple(
+    ((MOCK_BASE_DATE - timedelta(days=days)).strftime("%Y-%m-%d"),
+     (MOCK_BASE_DATE - timedelta(days=days)).isoformat())
+    for days in range(8)
+)
+
 # 地区
 REGIONS = ["美国", "欧盟", "中国", "日本", "韩国", "印度", "新加坡", "英国"]
 
@@ -224,125 +244,141 @@ def generate_mock_content(template: Dict[str, Any], index: int) -> Dict[str, Any
     Returns:
         Dict: mock 新闻数据
     """
-    company = random.choice(COMPANIES)
-    company2 = random.choice([c for c in COMPANIES if c != company])
-    investor = random.choice(INVESTORS)
-    source = random.choice(NEWS_SOURCES)
-    product = random.choice(PRODUCTS)
-    region = random.choice(REGIONS)
+    # 第二家公司从其余公司中等概率选取（下标落在第一家公司及之后时顺移一位）
+    company_idx = _rng.randrange(len(COMPANIES))
+    company = COMPANIES[company_idx]
+    company2_idx = _rng.randrange(len(COMPANIES) - 1)
+    company2 = COMPANIES[company2_idx + (company2_idx >= company_idx)]
+    investor = _rng.choice(INVESTORS)
+    source = _rng.choice(NEWS_SOURCES)
+    product = _rng.choice(PRODUCTS)
+    region = _rng.choice(REGIONS)
 
     # 随机数据
-    amount = random.choice(["5000万", "1亿", "2.5亿", "5亿", "10亿", "20亿", "50亿", "100亿"])
-    round_name = random.choice(["A", "B", "C", "D", "E", "Pre-IPO"])
-    percent = random.randint(15, 200)
-    quarter = random.randint(1, 4)
-    weeks = random.randint(12, 36)
-    year = random.randint(2025, 2030)
-    users = random.randint(100, 5000)
-    gpus = random.randint(10000, 100000)
+    amount = _rng.choice(["5000万", "1亿", "2.5亿", "5亿", "10亿", "20亿", "50亿", "100亿"])
+    round_name = _rng.choice(["A", "B", "C", "D", "E", "Pre-IPO"])
+    percent = _rng.randint(15, 200)
+    quarter = _rng.randint(1, 4)
+    weeks = _rng.randint(12, 36)
+    year = _rng.randint(2025, 2030)
+    users = _rng.randint(100, 5000)
+    gpus = _rng.randint(10000, 100000)
 
     # 替换模板中的占位符
     title = template["title_template"].format(
         company=company, amount=amount, round=round_name,
         percent=percent, product=product, region=region,
-        chip=random.choice(["H200", "B200", "MI400", "Gaudi 3"]),
+        chip=_rng.choice(["H200", "B200", "MI400", "Gaudi 3"]),
         acquirer=company, target=company2, partner=company2,
         quarter=quarter, weeks=weeks, year=year,
-        model=random.choice(["GPT-5", "Gemini 2", "Claude 4", "Llama 4"]),
-        benchmark=random.choice(["MMLU", "HumanEval", "GSM8K", "HellaSwag"]),
-        market=random.choice(["医疗", "金融", "教育", "制造业"]),
+        model=_rng.choice(["GPT-5", "Gemini 2", "Claude 4", "Llama 4"]),
+        benchmark=_rng.choice(["MMLU", "HumanEval", "GSM8K", "HellaSwag"]),
+        market=_rng.choice(["医疗", "金融", "教育", "制造业"]),
         competitor=company2, users=users, name=f"John_{index}",
-        regulation=random.choice(["数据安全要求", "算法透明度要求", "AI 伦理准则"]),
-        industry=random.choice(["医疗", "金融", "制造", "零售", "物流"]),
-        years=random.randint(3, 10)
+        regulation=_rng.choice(["数据安全要求", "算法透明度要求", "AI 伦理准则"]),
+        industry=_rng.choice(["医疗", "金融", "制造", "零售", "物流"]),
+        years=_rng.randint(3, 10)
     )
 
     content = template["content_template"].format(
         company=company, amount=amount, round=round_name,
-        investor=investor, purpose=random.choice(["技术研发", "市场拓展", "人才招聘", "基础设施建设"]),
-        valuation=random.choice(["10亿", "50亿", "100亿", "500亿"]),
-        product=product, percent=percent, technology=random.choice(["Transformer", "扩散模型", "多模态", "强化学习"]),
-        region=region, price=random.randint(100, 10000),
-        feature=random.choice(["智能分析", "自动化处理", "实时监控", "预测建模"]),
-        partner=company2, coverage=random.randint(100, 10000),
-        chip=random.choice(["H200", "B200", "MI400", "Gaudi 3"]),
-        efficiency=random.randint(20, 80),
-        customer=random.choice(["Microsoft", "Google", "Amazon", "Meta"]),
+        investor=investor, purpose=_rng.choice(["技术研发", "市场拓展", "人才招聘", "基础设施建设"]),
+        valuation=_rng.choice(["10亿", "50亿", "100亿", "500亿"]),
+        product=product, percent=percent,
+        technology=_rng.choice(["Transformer", "扩散模型", "多模态", "强化学习"]),
+        region=region, price=_rng.randint(100, 10000),
+        feature=_rng.choice(["智能分析", "自动化处理", "实时监控", "预测建模"]),
+        partner=company2, coverage=_rng.randint(100, 10000),
+        chip=_rng.choice(["H200", "B200", "MI400", "Gaudi 3"]),
+        efficiency=_rng.randint(20, 80),
+        customer=_rng.choice(["Microsoft", "Google", "Amazon", "Meta"]),
         weeks=weeks, quarter=quarter,
         acquirer=company, target=company2,
-        field=random.choice(["计算机视觉", "自然语言处理", "推荐系统", "机器人"]),
-        revenue=random.choice(["100亿", "200亿", "500亿", "1000亿"]),
-        growth=random.randint(10, 100),
-        guidance=random.choice(["500亿", "800亿", "1200亿"]),
-        regulation=random.choice(["数据本地化存储", "算法备案", "内容审核"]),
-        date=f"2025年{random.randint(1, 12)}月{random.randint(1, 28)}日",
-        target_region=random.choice(["中国", "俄罗斯", "中东"]),
-        model=random.choice(["GPT-5", "Gemini 2", "Claude 4", "Llama 4"]),
-        benchmark=random.choice(["MMLU", "HumanEval", "GSM8K"]),
-        score=random.randint(85, 99),
-        params=random.choice(["1万亿", "5000亿", "2000亿"]),
-        cost=random.choice(["5000万", "1亿", "5亿"]),
-        downloads=random.randint(10000, 1000000),
-        cagr=random.randint(15, 45),
-        segment=random.choice(["生成式AI", "计算机视觉", "NLP", "机器学习平台"]),
+        field=_rng.choice(["计算机视觉", "自然语言处理", "推荐系统", "机器人"]),
+        revenue=_rng.choice(["100亿", "200亿", "500亿", "1000亿"]),
+        growth=_rng.randint(10, 100),
+        guidance=_rng.choice(["500亿", "800亿", "1200亿"]),
+        regulation=_rng.choice(["数据本地化存储", "算法备案", "内容审核"]),
+        date=f"2025年{_rng.randint(1, 12)}月{_rng.randint(1, 28)}日",
+        target_region=_rng.choice(["中国", "俄罗斯", "中东"]),
+        model=_rng.choice(["GPT-5", "Gemini 2", "Claude 4", "Llama 4"]),
+        benchmark=_rng.choice(["MMLU", "HumanEval", "GSM8K"]),
+        score=_rng.randint(85, 99),
+        params=_rng.choice(["1万亿", "5000亿", "2000亿"]),
+        cost=_rng.choice(["5000万", "1亿", "5亿"]),
+        downloads=_rng.randint(10000, 1000000),
+        cagr=_rng.randint(15, 45),
+        segment=_rng.choice(["生成式AI", "计算机视觉", "NLP", "机器学习平台"]),
         name=f"CEO_{index}",
         prev_company=company2,
         competitor=company2,
         year=year,
         gpus=gpus,
         users=users,
-        mau=users * random.randint(3, 10),
-        minutes=random.randint(5, 60),
-        years=random.randint(3, 10),
-        industry=random.choice(["医疗", "金融", "制造", "零售"])
+        mau=users * _rng.randint(3, 10),
+        minutes=_rng.randint(5, 60),
+        years=_rng.randint(3, 10),
+        industry=_rng.choice(["医疗", "金融", "制造", "零售"])
     )
 
     # 使用固定的 Mock 日期: 2026-06-06
-    base_date = datetime(2026, 6, 6)
-    random_days = random.randint(0, 7)
-    news_date = base_date - timedelta(days=random_days)
+    news_date, published_at = MOCK_DATE_STRINGS[_rng.randint(0, 7)]
 
+    # 只包含 RSS 阶段已有的字段：抓取、特征等字段由后续步骤写入。不预先放 None 占位——
+    # 下游用 news.get("fetched_content", news.get("content")) 这类写法区分"尚未生成"
     return {
         "title": f"[Mock-v2-{index}] {title}",
         "content": content,
         "source": source,
-        "date": news_date.strftime("%Y-%m-%d"),
+        "date": news_date,
         "url": f"https://mock-news-v2.example.com/article/{index}",
-        "published_at": news_date.isoformat(),
+        "published_at": published_at,
         "mock_category": template["category"],
         "mock_signal": template["signal"]
     }
 
 
+def iter_mock_rss_data(count: int = 200) -> Iterator[Dict[str, Any]]:
+    """
+    逐条生成 mock RSS 搜索数据（惰性生成，调用方按需消费）
+
+    重置 _rng 的种子：后续 mock 抓取、轻量化特征等步骤沿用同一随机序列，
+    保证整个流程的数据可复现。
+
+    Args:
+        count: 生成的新闻数量
+
+    Yields:
+        Dict: mock 新闻数据
+    """
+    # v2: 使用不同的随机种子生成不同的数据
+    _rng.seed(20260606)
+    for i in range(1, count + 1):
+        template = _rng.choice(NEWS_TEMPLATES)
+        yield generate_mock_content(template, i)
+
+
 def generate_mock_rss_data(count: int = 200) -> List[Dict[str, Any]]:
     """
     生成 mock RSS 搜索数据
 
+    normalize_news 需要完整列表（先取前 max_items 条），因此这里一次性收集生成结果。
+
     Args:
         count: 生成的新闻数量
 
     Returns:
         List[Dict]: mock 新闻列表
     """
-    # v2: 使用不同的随机种子生成不同的数据
-    random.seed(20260606)
     logger.info(f"开始生成 {count} 条 mock RSS 数据 (v2 版本)...")
 
-    news_list = []
-    for i in range(1, count + 1):
-        template = random.choice(NEWS_TEMPLATES)
-        news = generate_mock_content(template, i)
-        news_list.append(news)
-
+    news_list = list(iter_mock_rss_data(count))
     logger.info(f"生成完成，共 {len(news_list)} 条新闻")
 
-    # 统计类别分布
-    category_stats = {}
-    for news in news_list:
-        cat = news.get("mock_category", "unknown")
-        category_stats[cat] = category_stats.get(cat, 0) + 1
-
-    logger.info(f"类别分布: {category_stats}")
+    # 类别分布只用于日志：INFO 关闭时不统计也不格式化字典
+    if logger.isEnabledFor(logging.INFO):
+        category_stats = Counter(news.get("mock_category", "unknown") for news in news_list)
+        logger.info(f"类别分布: {dict(category_stats)}")
 
     return news_list
 
@@ -357,28 +393,31 @@ def mock_fetch_article(news: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict: 添加了抓取内容的新闻
     """
-    # 生成更长的内容（模拟网页抓取）
-    fetched_content = news["content"] + "\n\n"
-
-    # 添加更多细节
-    fetched_content += "【详细报道】\n"
-    fetched_content += f"本报道来源于 {news['source']}，发布时间为 {news['date']}。\n\n"
-
-    # 添加一些数字和引用
-    fetched_content += f"据悉，此次事件涉及金额约 ${random.randint(100, 1000)}万美元。"
-    fetched_content += "行业分析师表示：\"这是一个重要的里程碑，将对行业产生深远影响。\"\n\n"
-
-    # 添加更多背景信息
-    fetched_content += f"背景信息：该公司成立于 {random.randint(2010, 2023)} 年，"
-    fetched_content += f"目前员工规模约 {random.randint(100, 10000)} 人，"
-    fetched_content += f"年营收约 ${random.randint(10, 500)} 亿美元。"
+    # 先抽取随机数字，再生成更长的内容（模拟网页抓取）
+    amount = _rng.randint(100, 1000)
+    founded = _rng.randint(2010, 2023)
+    employees = _rng.randint(100, 10000)
+    revenue = _rng.randint(10, 500)
+    fetched_content = (
+        f"{news['content']}\n\n"
+        # 添加更多细节
+        "【详细报道】\n"
+        f"本报道来源于 {news['source']}，发布时间为 {news['date']}。\n\n"
+        # 添加一些数字和引用
+        f"据悉，此次事件涉及金额约 ${amount}万美元。"
+        "行业分析师表示：\"这是一个重要的里程碑，将对行业产生深远影响。\"\n\n"
+        # 添加更多背景信息
+        f"背景信息：该公司成立于 {founded} 年，"
+        f"目前员工规模约 {employees} 人，"
+        f"年营收约 ${revenue} 亿美元。"
+    )
 
     news["fetched_content"] = fetched_content
     news["fetched_title"] = news["title"]
     news["fetch_stats"] = {
         "status_code": 200,
         "content_length": len(fetched_content),
-        "fetch_time_ms": random.randint(100, 2000)
+        "fetch_time_ms": _rng.randint(100, 2000)
     }
 
     return news
@@ -425,16 +464,11 @@ def run_full_flow_test():
     # 第三步：原文抓取（Mock）
     # ============================================
     logger.info("\n第三步：原文抓取（Mock）...")
-    fetch_stats = {"total": 0, "success": 0, "failed": 0}
-
+    # Mock 抓取只做字符串拼接和随机数抽取，不会像真实抓取那样失败；
+    # 不逐条捕获异常，真有错误时直接暴露，由 main() 记录
     for news in news_list:
-        fetch_stats["total"] += 1
-        try:
-            mock_fetch_article(news)
-            fetch_stats["success"] += 1
-        except Exception as e:
-            fetch_stats["failed"] += 1
-            logger.error(f"Mock 抓取失败: {e}")
+        mock_fetch_article(news)
+    fetch_stats = {"total": len(news_list), "success": len(news_list), "failed": 0}
 
     stats["fetch_stats"] = fetch_stats
     logger.info(f"Mock 抓取完成: 成功 {fetch_stats['success']}/{fetch_stats['total']}")
@@ -456,19 +490,21 @@ def run_full_flow_test():
     # 第五步：轻量化特征抽取（简化版 Mock）
     # ============================================
     logger.info("\n第五步：轻量化特征抽取（Mock）...")
+    # 不与第三步合并为一次遍历：步骤顺序与 main.py 的正式流程一致，特征只为去重合并后的
+    # 新闻抽取；提前到抓取循环里会为被合并掉的新闻多抽随机数，改变后续步骤的数据
     light_stats = {"total": 0, "success": 0}
 
     for news in processed_news:
         light_stats["total"] += 1
         content = news.get("fetched_content", news.get("content", ""))
 
-        # Mock 轻量化特征
+        # Mock 轻量化特征（真实特征抽取在 fetch.light_features_extractor 中实现）
         news["light_features"] = {
             "content_length": len(content),
-            "has_numbers": bool(random.random() > 0.3),  # 70% 概率有数字
-            "has_quote": bool(random.random() > 0.5),     # 50% 概率有引用
-            "company_count": random.randint(1, 5),
-            "signal_term_count": random.randint(0, 8)
+            "has_numbers": _rng.random() > 0.3,  # 70% 概率有数字
+            "has_quote": _rng.random() > 0.5,     # 50% 概率有引用
+            "company_count": _rng.randint(1, 5),
+            "signal_term_count": _rng.randint(0, 8)
         }
         light_stats["success"] += 1
 
@@ -500,14 +536,14 @@ def run_full_flow_test():
         # Mock 投资信息
         news["investment_info"] = {
             "core_thesis": f"关于 {news.get('title', '')[:30]} 的投资分析",
-            "market_impact": random.choice(["积极影响", "中性影响", "需要观察"]),
+            "market_impact": _rng.choice(["积极影响", "中性影响", "需要观察"]),
             "risk_factors": [
-                random.choice(["市场竞争", "技术风险", "监管风险", "执行风险"]),
-                random.choice(["估值过高", "盈利能力", "现金流", "人才流失"])
+                _rng.choice(["市场竞争", "技术风险", "监管风险", "执行风险"]),
+                _rng.choice(["估值过高", "盈利能力", "现金流", "人才流失"])
             ],
-            "time_horizon": random.choice(["短期", "中期", "长期"]),
-            "related_tickers": random.sample(["NVDA", "MSFT", "GOOGL", "META", "AMZN", "AMD", "INTC"], k=random.randint(1, 3)),
-            "confidence_level": random.choice(["高", "中", "低"])
+            "time_horizon": _rng.choice(["短期", "中期", "长期"]),
+            "related_tickers": _rng.sample(TICKERS, k=_rng.randint(1, 3)),
+            "confidence_level": _rng.choice(["高", "中", "低"])
         }
         news["ai_summary"] = f"这是一条关于 AI 行业的重要新闻。{news['content'][:100]}..."
         extract_stats["success"] += 1
@@ -532,9 +568,9 @@ def run_full_flow_test():
             events.append({
                 "representative_title": final_news[i].get("title", f"Mock 事件 {i + 1}"),
                 "summary": final_news[i].get("ai_summary", "这是一个 Mock 事件摘要"),
-                "news_count": random.randint(1, 5),
+                "news_count": _rng.randint(1, 5),
                 "sources": [final_news[i].get("source", "Mock Source")],
-                "companies": random.sample(COMPANIES[:10], k=random.randint(1, 3)),
+                "companies": _rng.sample(TOP_COMPANIES, k=_rng.randint(1, 3)),
                 "news_indices": [i]
             })
         stats["event_stats"] = {"mock": True, "events_count": len(events)}
@@ -554,9 +590,9 @@ def run_full_flow_test():
         # Mock 决策
         for event in events:
             event["decision"] = {
-                "importance": random.choice(["High", "Medium", "Low"]),
-                "signal": random.choice(["Positive", "Neutral", "Risk"]),
-                "action": random.choice(["Watch", "Hold", "Avoid"])
+                "importance": _rng.choice(["High", "Medium", "Low"]),
+                "signal": _rng.choice(["Positive", "Neutral", "Risk"]),
+                "action": _rng.choice(["Watch", "Hold", "Avoid"])
             }
         stats["decision_stats"] = {"mock": True}
 
@@ -576,8 +612,7 @@ def run_full_flow_test():
         os.makedirs(output_dir, exist_ok=True)
 
         # 使用固定的 Mock 日期
-        date_str = "20260606"
-        filename = f"mock_ai_invest_article_{date_str}.md"
+        filename = f"mock_ai_invest_article_{MOCK_DATE_COMPACT}.md"
         file_path = os.path.join(output_dir, filename)
 
         with open(file_path, "w", encoding="utf-8") as f:
@@ -595,9 +630,8 @@ def run_full_flow_test():
     logger.info("\n第十一步：H5 应用数据导出...")
 
     # 构建结果数据（使用固定的 Mock 日期）
-    mock_date = "2026-06-06"
     result = {
-        "date": mock_date,
+        "date": MOCK_DATE_ISO,
         "news": final_news,
         "events": events
     }
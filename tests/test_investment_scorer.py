@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InvestmentScorer 单元测试
+
+覆盖7维度评分与评级逻辑。
+"""
+
+import logging
+import os
+import sys
+
+# 添加 src 目录到 Python 路径
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(PROJECT_ROOT, 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from selector.investment_scorer import InvestmentScorer
+
+# 配置日志
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+SAMPLE_NEWS = {
+    "title": "OpenAI获66亿美元融资，估值达1570亿美元",
+    "content": "OpenAI 首次披露新模型的企业收入",
+    "source": "Bloomberg",
+    "companies": ["OpenAI", "Microsoft"],
+    "signals": ["funding", "product_commercial"],
+    "light_features": {"has_quote": True},
+    "investment_info": {
+        "facts": ["OpenAI完成新一轮融资"],
+        "numbers": ["66亿美元", "1570亿美元估值"],
+        "industry_impact": ["竞争格局变化"],
+        "uncertainties": ["监管风险"],
+        "investment_thesis": {"bear_case": ["估值过高", "竞争加剧"], "time_horizon": "1-3个月"},
+    },
+}
+
+
+def test_scorecard_without_reasoning_has_same_scores():
+    """测试关闭说明生成时分数与评级不变，reasoning 为空"""
+    scorer = InvestmentScorer()
+
+    full = scorer.calculate_scorecard(SAMPLE_NEWS).to_dict()
+    scores_only = scorer.calculate_scorecard(SAMPLE_NEWS, collect_reasoning=False).to_dict()
+
+    assert full.pop("reasoning")["materiality"].startswith("包含2个数字信息")
+    assert scores_only.pop("reasoning") == {}
+    assert scores_only == full
+    assert full["composite_score"] == 79.5
+    assert full["investment_rating"] == "Monitor"
+
+
+def test_empty_news_is_pass():
+    """测试空新闻得到最低评级"""
+    scorecard = InvestmentScorer().calculate_scorecard({})
+
+    assert scorecard.investment_rating == "Pass"
+    assert scorecard.reasoning["conviction"] == "一般来源: "
+
+
+if __name__ == "__main__":
+    test_scorecard_without_reasoning_has_same_scores()
+    test_empty_news_is_pass()
+    print("✓ 所有测试通过")
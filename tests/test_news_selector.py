@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+NewsSelectorPipeline 单元测试
+
+覆盖关键词扫描与新闻评分逻辑。
+"""
+
+import logging
+import os
+import sys
+
+# 添加 src 目录到 Python 路径
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(PROJECT_ROOT, 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from selector.news_selector import NewsSelectorPipeline
+
+# 配置日志
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+SAMPLE_TEXTS = [
+    "nvidia reports record earnings as h100 chip demand surges",
+    "we are excited to launch our enterprise platform",
+    "opinion: how to think about export control policy",
+    "openai raised a new series c round; microsoft and amd join",
+    "a quiet day with nothing notable",
+]
+
+
+def test_scan_matches_keyword_helpers():
+    """测试一次扫描的结果与逐个关键词查找一致"""
+    pipeline = NewsSelectorPipeline()
+
+    for text in SAMPLE_TEXTS:
+        expected = (
+            pipeline._detect_events(text),
+            pipeline._detect_companies(text),
+            pipeline._contains_any(text, pipeline.PR_PATTERNS),
+            pipeline._contains_any(text, pipeline.OPINION_PATTERNS),
+        )
+        assert pipeline._scan(text) == expected, text
+
+
+def test_select_news_ranks_event_news_first():
+    """测试含投资事件和重点公司的新闻排在前面，PR 稿被过滤"""
+    news = [
+        {"title": "We are excited to share", "summary": "we are excited to announce a groundbreaking product"},
+        {"title": "NVIDIA earnings beat", "summary": "NVIDIA revenue rose 50% to $35 billion on H100 chip demand"},
+    ]
+
+    selected, stats = NewsSelectorPipeline(top_k=2).select_news(news)
+
+    assert [n["title"] for n in selected] == ["NVIDIA earnings beat"]
+    assert selected[0]["signals"] == ["earnings", "chip_supply"]
+    assert selected[0]["companies"] == ["nvidia"]
+    assert stats["dropped_count"] == 1
+
+
+if __name__ == "__main__":
+    test_scan_matches_keyword_helpers()
+    test_select_news_ranks_event_news_first()
+    print("✓ 所有测试通过")
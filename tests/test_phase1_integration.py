@@ -8,6 +8,9 @@ Phase 1 集成测试
 
 import sys
 import os
+import tempfile
+import traceback
+from functools import lru_cache
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from fetch.investment_extractor import InvestmentExtractor, InvestmentInfo, InvestmentThesis
@@ -16,8 +19,13 @@ from content import ArticleBuilder, MarkdownRenderer
 from content.article_schema import ArticleEvent
 
 
+@lru_cache(maxsize=None)
 def _create_mock_investment_info():
-    """创建模拟的投资信息（内部辅助函数）"""
+    """
+    创建模拟的投资信息（内部辅助函数）
+
+    各测试只读取该对象，缓存后整个模块共用同一份，不再每个测试重建一遍。
+    """
     return InvestmentInfo(
         facts=[
             "OpenAI完成66亿美元融资",
@@ -68,6 +76,24 @@ def _create_mock_investment_info():
     )
 
 
+@lru_cache(maxsize=None)
+def _mock_investment_info_dict():
+    """模拟投资信息的字典形式（只转换一次）"""
+    return _create_mock_investment_info().to_dict()
+
+
+def _create_mock_news():
+    """创建带模拟投资信息的测试新闻（每次返回新字典，投资信息字典共用）"""
+    return {
+        "title": "OpenAI获66亿美元融资，估值达1570亿美元",
+        "source": "Bloomberg",
+        "companies": ["OpenAI", "Microsoft"],
+        "signals": ["funding", "partnership"],
+        "light_features": {"has_quote": True},
+        "investment_info": _mock_investment_info_dict(),
+    }
+
+
 def test_investment_thesis_extraction():
     """测试投资论点提取"""
     print("=" * 60)
@@ -96,18 +122,8 @@ def test_investment_scorecard():
     print("测试2: 投资评分卡计算")
     print("=" * 60)
 
-    # 创建模拟投资信息
-    investment_info = _create_mock_investment_info()
-
     # 创建测试新闻
-    test_news = {
-        "title": "OpenAI获66亿美元融资，估值达1570亿美元",
-        "source": "Bloomberg",
-        "companies": ["OpenAI", "Microsoft"],
-        "signals": ["funding", "partnership"],
-        "light_features": {"has_quote": True},
-        "investment_info": investment_info.to_dict(),
-    }
+    test_news = _create_mock_news()
 
     # 计算评分卡
     scorecard = calculate_investment_scorecard(test_news)
@@ -134,24 +150,15 @@ def test_tiered_events():
     print("测试3: 分层事件和报告渲染")
     print("=" * 60)
 
-    # 创建模拟投资信息和评分卡
-    investment_info = _create_mock_investment_info()
-    test_news = {
-        "title": "OpenAI获66亿美元融资，估值达1570亿美元",
-        "source": "Bloomberg",
-        "companies": ["OpenAI", "Microsoft"],
-        "signals": ["funding", "partnership"],
-        "light_features": {"has_quote": True},
-        "investment_info": investment_info.to_dict(),
-    }
+    # 创建测试新闻和评分卡
+    test_news = _create_mock_news()
     scorecard = calculate_investment_scorecard(test_news)
 
     # 创建多个测试事件（不同评分）
     events = []
 
     # Tier 1 事件（高分）
-    test_news_tier1 = test_news.copy()
-    test_news_tier1["investment_scorecard"] = scorecard.to_dict()
+    test_news_tier1 = {**test_news, "investment_scorecard": scorecard.to_dict()}
 
     event1 = {
         "representative_title": "OpenAI获66亿美元融资，估值达1570亿美元",
@@ -164,8 +171,7 @@ def test_tiered_events():
     events.append(event1)
 
     # Tier 2 事件（中等分）
-    test_news_tier2 = test_news.copy()
-    test_news_tier2["investment_scorecard"] = {
+    test_news_tier2 = {**test_news, "investment_scorecard": {
         "composite_score": 60.0,
         "materiality_score": 6.0,
         "urgency_score": 5.0,
@@ -174,7 +180,7 @@ def test_tiered_events():
         "risk_score": 4.0,
         "innovation_score": 6.0,
         "investment_rating": "Monitor"
-    }
+    }}
 
     event2 = {
         "representative_title": "Google发布新AI模型",
@@ -187,11 +193,10 @@ def test_tiered_events():
     events.append(event2)
 
     # Tier 3 事件（低分）
-    test_news_tier3 = test_news.copy()
-    test_news_tier3["investment_scorecard"] = {
+    test_news_tier3 = {**test_news, "investment_scorecard": {
         "composite_score": 40.0,
         "investment_rating": "Pass"
-    }
+    }}
 
     event3 = {
         "representative_title": "某AI创业公司获种子轮融资",
@@ -225,12 +230,14 @@ def test_tiered_events():
     print(f"\n✅ Markdown渲染成功")
     print(f"   - 文章长度: {len(markdown_content)} 字符")
 
-    # 保存到文件
-    output_file = "/tmp/test_phase1_report.md"
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(markdown_content)
-
-    print(f"   - 报告已保存: {output_file}")
+    # 报告文件仅供人工查看，设置 SAVE_REPORT 环境变量时才保存
+    # （每次运行独立的临时文件，多个测试进程同时运行时不会互相覆盖）
+    if os.environ.get("SAVE_REPORT"):
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", prefix="test_phase1_report_", suffix=".md", delete=False
+        ) as f:
+            f.write(markdown_content)
+        print(f"   - 报告已保存: {f.name}")
 
     # pytest 断言验证
     assert len(article.events) == 3
@@ -260,7 +267,6 @@ def main():
 
     except Exception as e:
         print(f"\n❌ 测试失败: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SearchResultProcessor 单元测试
+
+覆盖规范化、去重、合并相似新闻等核心处理逻辑。
+"""
+
+import logging
+import os
+import sys
+
+# 添加 src 目录到 Python 路径
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(PROJECT_ROOT, 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from search.rss_config import MAX_NORMALIZED_ITEMS
+from search.search_pipeline_v2 import SearchPipelineV2
+from search.search_result_process import SearchResultProcessor, _normalize_text
+
+# 配置日志
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def _make_news(title: str, url: str, source: str = "TechCrunch") -> dict:
+    """构造一条测试新闻"""
+    return {
+        "title": title,
+        "content": f"{title} 的正文内容",
+        "source": source,
+        "date": "2026-01-19 10:00",
+        "url": url,
+    }
+
+
+def test_normalize_text():
+    """测试短文本规范化：只去除首尾空白，不改动中间的空白"""
+    assert _normalize_text("  OpenAI\n发布   新模型\t") == "OpenAI\n发布   新模型"
+    assert _normalize_text("GPT-5") == "GPT-5"
+
+
+def test_normalize_news_strips_title():
+    """测试规范化去除标题首尾空白，标题中间的空白保持原样"""
+    processor = SearchResultProcessor(max_items=10)
+    raw = [_make_news("  NVIDIA  reports\nrecord revenue \n", "https://example.com/1")]
+
+    normalized, source_count = processor.normalize_news(raw)
+
+    assert len(normalized) == 1
+    assert normalized[0]["title"] == "NVIDIA  reports\nrecord revenue"
+    assert source_count == {"TechCrunch": 1}
+
+
+def test_deduplicate_news_ignores_case_and_surrounding_whitespace():
+    """测试去重键忽略大小写和首尾空白"""
+    processor = SearchResultProcessor()
+    news = [
+        _make_news("OpenAI Launches GPT-5", "https://example.com/1"),
+        _make_news(" openai launches gpt-5 ", "https://example.com/1"),
+        _make_news("OpenAI Launches GPT-5", "https://example.com/2"),
+    ]
+
+    result, stats = processor.deduplicate_news(news)
+
+    assert len(result) == 2
+    assert stats["removed_count"] == 1
+
+
+def test_is_similar_is_symmetric():
+    """测试相似判断与参数顺序无关，且非字符串标题视为不相似"""
+    processor = SearchResultProcessor(similarity_threshold=0.6)
+    a = "OpenAI launches GPT-5 model"
+    b = "openai launches gpt-5 today"
+
+    assert processor.is_similar(a, b)
+    assert processor.is_similar(b, a)
+    assert not processor.is_similar(a, "NVIDIA earnings beat estimates")
+    assert not processor.is_similar(a, None)
+
+
+def test_is_similar_handles_cjk_titles():
+    """测试中文标题按字分词，无空格的近似标题也能判为相似"""
+    processor = SearchResultProcessor(similarity_threshold=0.6)
+
+    assert processor.is_similar("OpenAI 发布新的 GPT 模型", "OpenAI发布了新GPT模型")
+    assert not processor.is_similar("OpenAI 发布新的 GPT 模型", "英伟达财报超预期")
+
+
+def test_merge_similar_news_keeps_non_string_titles():
+    """测试未声明已校验时，非字符串标题的条目被保留（视为与其他新闻不相似）"""
+    news = [
+        _make_news("OpenAI launches GPT-5", "https://example.com/1"),
+        {**_make_news("placeholder", "https://example.com/2"), "title": 12345},
+    ]
+
+    result, stats = SearchResultProcessor().merge_similar_news(news)
+
+    assert [n["url"] for n in result] == ["https://example.com/1", "https://example.com/2"]
+    assert stats["merged_count"] == 0
+
+
+def _merge_by_is_similar(processor: SearchResultProcessor, news_list: list) -> list:
+    """按定义逐条两两调用 is_similar 合并，作为 merge_similar_news 的参照结果"""
+    kept = []
+    for news in news_list:
+        if not any(processor.is_similar(news["title"], k["title"]) for k in kept):
+            kept.append(news)
+    return kept
+
+
+def test_merge_similar_news_keeps_contained_short_titles_merged():
+    """测试短标题被长标题包含时（重叠率高、Jaccard 低）在大批量输入下仍会合并"""
+    news = []
+    for i in range(150):
+        # 4 个词的短标题完整包含在多 16 个词的长标题中：重叠率为 1，Jaccard 仅 0.2
+        short = [f"topic{i}word{j}" for j in range(4)]
+        extra = [f"filler{i}word{j}" for j in range(16)]
+        news.append(_make_news(" ".join(extra[:8] + short + extra[8:]), f"https://example.com/long{i}"))
+        news.append(_make_news(" ".join(short), f"https://example.com/short{i}"))
+
+    processor = SearchResultProcessor()
+    result, stats = processor.merge_similar_news(news)
+
+    assert [n["url"] for n in result] == [n["url"] for n in _merge_by_is_similar(processor, news)]
+    assert stats["output_count"] == 150
+    assert stats["merged_count"] == 150
+
+
+def test_merge_similar_news_matches_is_similar():
+    """测试倒排索引候选路径与逐条 is_similar 判断结果一致"""
+    news = []
+    for i in range(150):
+        news.append(_make_news(f"company{i} unveils product{i} at event{i} today", f"https://example.com/{i}"))
+        # 每条新闻对应一条词序不同、多一个词的近似重复
+        news.append(_make_news(f"today company{i} unveils new product{i} at event{i}", f"https://example.com/dup{i}"))
+
+    processor = SearchResultProcessor()
+    result, stats = processor.merge_similar_news(news)
+
+    assert [n["url"] for n in result] == [n["url"] for n in _merge_by_is_similar(processor, news)]
+    assert stats["output_count"] == 150
+
+
+class _RecordingProcessor(SearchResultProcessor):
+    """记录 merge_similar_news 收到的 validated 参数"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.validated_calls = []
+
+    def merge_similar_news(self, news_list, validated=False):
+        self.validated_calls.append(validated)
+        return super().merge_similar_news(news_list, validated=validated)
+
+
+def test_process_results_passes_validated_to_merge():
+    """测试 process_results 只在输入经过规范化时让合并步骤走 validated 路径"""
+    news = [
+        _make_news("OpenAI launches GPT-5 model", "https://example.com/1"),
+        _make_news("OpenAI launches GPT-5 model today", "https://example.com/2"),
+        _make_news("NVIDIA reports record quarterly revenue", "https://example.com/3"),
+    ]
+    pipeline = SearchPipelineV2(use_concurrent=False)
+    processor = _RecordingProcessor(max_items=MAX_NORMALIZED_ITEMS)
+    pipeline._processor = processor
+
+    # 与 main.py / run_pipeline 一致：输入已由 normalize_news 规范化
+    normalized, _ = processor.normalize_news(news)
+    result, stats = pipeline.process_results(normalized, skip_normalize=True, validated=True)
+    assert [n["url"] for n in result] == ["https://example.com/1", "https://example.com/3"]
+    assert stats["step3_merge"]["merged_count"] == 1
+
+    # 未跳过规范化时同样走 validated 路径；跳过规范化且未声明时逐条检查
+    pipeline.process_results(news)
+    pipeline.process_results(news, skip_normalize=True)
+    assert processor.validated_calls == [True, True, False]
+
+
+if __name__ == "__main__":
+    test_normalize_text()
+    test_normalize_news_strips_title()
+    test_deduplicate_news_ignores_case_and_surrounding_whitespace()
+    test_is_similar_is_symmetric()
+    test_is_similar_handles_cjk_titles()
+    test_merge_similar_news_keeps_non_string_titles()
+    test_merge_similar_news_keeps_contained_short_titles_merged()
+    test_merge_similar_news_matches_is_similar()
+    test_process_results_passes_validated_to_merge()
+    print("✓ 所有测试通过")
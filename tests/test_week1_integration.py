@@ -46,7 +46,6 @@ def test_sec_collector():
 
     print(f"  ✅ 获取到 {len(filings)} 个测试文件")
     print(f"  ✅ 优先级计算正常: {priority}")
-    return True
 
 
 def test_regulatory_collector():
@@ -70,7 +69,6 @@ def test_regulatory_collector():
 
     print("  ✅ AI关键词检测正常")
     print("  ✅ 优先级计算正常: P0")
-    return True
 
 
 def test_alert_system():
@@ -113,7 +111,6 @@ def test_alert_system():
     print(f"  ✅ SEC警报生成正常: {alert.title}")
     print(f"  ✅ 监管警报生成正常: {alert2.title[:40]}...")
     print(f"  ✅ P0警报数量: {len(p0_alerts)}")
-    return True
 
 
 def test_precision_monitor():
@@ -150,7 +147,6 @@ def test_precision_monitor():
     print(f"  ✅ 监控运行正常")
     print(f"  ✅ P0回调触发: {len(p0_received)} 次")
     print(f"  ✅ 警报生成: {stats['alerts_generated']} 条")
-    return True
 
 
 def test_alert_priority_logic():
@@ -199,7 +195,6 @@ def test_alert_priority_logic():
     print("  ✅ 8-K 其他 → P1")
     print("  ✅ 13D → P1")
     print("  ✅ 13G → P2")
-    return True
 
 
 def test_investment_signal_logic():
@@ -236,7 +231,6 @@ def test_investment_signal_logic():
     print("  ✅ 资产处置 → Negative")
     print("  ✅ 调查 → Negative + Immediate")
     print("  ✅ 驳回 → Positive")
-    return True
 
 
 def test_end_to_end():
@@ -262,7 +256,6 @@ def test_end_to_end():
 
     print(f"  ✅ 端到端流程正常")
     print(f"  ✅ 总警报数: {total_alerts}")
-    return True
 
 
 def run_all_tests():
@@ -284,8 +277,8 @@ def run_all_tests():
     results = []
     for name, test_func in tests:
         try:
-            success = test_func()
-            results.append((name, success, None))
+            test_func()
+            results.append((name, True, None))
         except Exception as e:
             results.append((name, False, str(e)))
             print(f"  ❌ 错误: {e}")
@@ -71,7 +71,6 @@ def test_blog_collector():
     print(f"  ✅ 生成 {len(posts)} 篇测试文章")
     print(f"  ✅ 优先级计算正常")
     print(f"  ✅ 信号提取正常")
-    return True
 
 
 def test_stock_monitor():
@@ -103,7 +102,6 @@ def test_stock_monitor():
     print(f"  ✅ 生成 {len(alerts)} 个测试警报")
     print(f"  ✅ 警报结构正确")
     print(f"  ✅ 阈值逻辑正确")
-    return True
 
 
 def test_notifier():
@@ -159,7 +157,6 @@ def test_notifier():
     print("  ✅ P1通知加入队列")
     print("  ✅ P2通知加入队列")
     print("  ✅ 统计信息正确")
-    return True
 
 
 def test_notifier_from_sources():
@@ -206,7 +203,6 @@ def test_notifier_from_sources():
 
     print("  ✅ 博客通知转换正确")
     print("  ✅ 股票通知转换正确")
-    return True
 
 
 def test_precision_monitor_v2():
@@ -227,7 +223,7 @@ def test_precision_monitor_v2():
 
     monitor = PrecisionMonitor(config)
 
-    # 运行一次
+    # 运行一次（各采集器在 run_once 内自行生成测试数据，不注入其他测试的结果）
     results = monitor.run_once()
 
     # 验证结果结构
@@ -256,7 +252,6 @@ def test_precision_monitor_v2():
     print(f"  ✅ GitHub检查: {stats['github_checks']} 次, 数据: {len(results['github_repos'])}")
     print(f"  ✅ HN检查: {stats['hackernews_checks']} 次, 数据: {len(results['hackernews_stories'])}")
     print(f"  ✅ 生成警报: {stats['alerts_generated']} 条")
-    return True
 
 
 def test_end_to_end_v2():
@@ -293,7 +288,6 @@ def test_end_to_end_v2():
     print(f"  ✅ P0警报: {total_p0}")
     print(f"  ✅ P1警报: {total_p1}")
     print(f"  ✅ P2警报: {total_p2}")
-    return True
 
 
 def test_webhook_payload():
@@ -330,8 +324,6 @@ def test_webhook_payload():
 
         print(f"  ✅ {platform} payload格式正确")
 
-    return True
-
 
 def test_twitter_monitor():
     """测试Twitter监控器"""
@@ -365,7 +357,6 @@ def test_twitter_monitor():
     print(f"  ✅ 生成 {len(tweets)} 条测试推文")
     print(f"  ✅ 优先级计算正常")
     print(f"  ✅ 信号提取正常")
-    return True
 
 
 def test_github_monitor():
@@ -398,7 +389,6 @@ def test_github_monitor():
 
     print(f"  ✅ 生成 {len(repos)} 个测试项目")
     print(f"  ✅ AI相关判断正确")
-    return True
 
 
 def test_hackernews_monitor():
@@ -432,7 +422,6 @@ def test_hackernews_monitor():
 
     print(f"  ✅ 生成 {len(stories)} 条测试stories")
     print(f"  ✅ AI相关判断正确")
-    return True
 
 
 def run_all_tests():
@@ -457,8 +446,8 @@ def run_all_tests():
     results = []
     for name, test_func in tests:
         try:
-            success = test_func()
-            results.append((name, success, None))
+            test_func()
+            results.append((name, True, None))
         except Exception as e:
             results.append((name, False, str(e)))
             print(f"  ❌ 错误: {e}")